@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+
+"""Cluster benchmark for SeroTools.
+
+SeroClust compares the unique formulas of a cluster with each other. It used to create
+two WKLMSerovar objects for every cell of the full u x u matrix (reproduced below),
+re-running standardization and the scheme lookup each time. It now resolves each
+formula once and compares each pair once (comparison_matrix). For clusters of u
+distinct formulas, the latency of both versions is reported, after checking that the
+matrices agree. The comparison cache is cleared before each measurement.
+
+Usage:
+    $ python benchmarks/bench_cluster.py [max_formulas]
+"""
+
+import logging
+import random
+import sys
+import time
+import numpy as np
+from serotools import serotools as st
+
+
+def previous_comparisons(formulas):
+    """The comparisons of SeroClust, as they were before comparison_matrix."""
+
+    return [[st.comparison_results[st.comparison_level(st.WKLMSerovar(s1), st.WKLMSerovar(s2))]
+             for s2 in formulas] for s1 in formulas]
+
+
+def current_comparisons(formulas):
+    levels = st.comparison_matrix([st.WKLMSerovar(f) for f in formulas])
+    return [[st.comparison_results[level] for level in row] for row in levels]
+
+
+def formulas(u, seed=0):
+    """Returns u distinct formulas of the repository, and spellings of them."""
+
+    scheme = st.get_scheme()
+    pool = sorted(set(f for f in scheme.columns['Formula'] if isinstance(f, str)))
+    rnd = random.Random(seed)
+    sample = rnd.sample(pool, u)
+    return [f.replace('[', '').replace(']', '') if i % 3 == 2 else f for i, f in enumerate(sample)]
+
+
+def main():
+    max_u = int(sys.argv[1]) if len(sys.argv) > 1 else 320
+    logging.disable(logging.CRITICAL)
+    st.get_scheme().df  # load the scheme before measuring
+
+    print('{:>6}{:>16}{:>16}{:>10}'.format('u', 'previous (s)', 'current (s)', 'speedup'))
+    for u in [10, 20, 40, 80, 160, 320]:
+        if u > max_u:
+            break
+        fs = formulas(u)
+        timings, results = [], []
+        for f in (previous_comparisons, current_comparisons):
+            st.comparison_cache.clear()
+            start = time.perf_counter()
+            results.append(f(fs))
+            timings.append(time.perf_counter() - start)
+        assert np.array_equal(np.array(results[0]), np.array(results[1])), u
+        print('{:>6}{:>16.3f}{:>16.3f}{:>9.1f}x'.format(u, timings[0], timings[1], timings[0] / timings[1]))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+
+"""Compare scaling benchmark for SeroTools.
+
+compare reads its input file in chunks of compare_chunk_size lines, and with jobs > 1
+compares the chunks in a pool of processes. A file of random pairs of repository names,
+repository formulas and formulas which are not in the repository is compared with 1 to
+max_jobs processes; the elapsed time, throughput and speedup over one process are
+reported, after checking that the output is the same.
+
+Usage:
+    $ python benchmarks/bench_compare.py [n_pairs] [max_jobs]
+"""
+
+import contextlib
+import io
+import logging
+import os
+import random
+import sys
+import tempfile
+import time
+from serotools import serotools as st
+
+
+def pairs_file(n, path, seed=0):
+    """Writes n random pairs of serovars to a tab-delimited file."""
+
+    scheme = st.get_scheme()
+    pool = scheme.columns['Name'][::3] + scheme.columns['Formula'][1::3] + \
+        [f + ':[z99]' for f in scheme.columns['Formula'][2::9]]
+    rnd = random.Random(seed)
+    with open(path, 'w') as f:
+        for _ in range(n):
+            f.write('{}\t{}\n'.format(rnd.choice(pool), rnd.choice(pool)))
+
+
+def run(path, jobs):
+    """Returns the output of compare and the elapsed time (s)."""
+
+    out = io.StringIO()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(out):
+        st.compare(input_file=path, jobs=jobs)
+    return out.getvalue(), time.perf_counter() - start
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    max_jobs = int(sys.argv[2]) if len(sys.argv) > 2 else os.cpu_count()
+    logging.disable(logging.CRITICAL)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, 'pairs.tsv')
+        pairs_file(n, path)
+
+        print('{} pairs, {} cpus'.format(n, os.cpu_count()))
+        print('{:>6}{:>14}{:>16}{:>10}'.format('jobs', 'elapsed (s)', 'pairs per s', 'speedup'))
+        for jobs in sorted(set([2 ** i for i in range(max_jobs.bit_length())] + [max_jobs])):
+            st.wklm_cache.clear()
+            st.comparison_cache.clear()
+            output, elapsed = run(path, jobs)
+            if jobs == 1:
+                expected, serial = output, elapsed
+            assert output == expected, jobs
+            print('{:>6}{:>14.2f}{:>16.0f}{:>9.1f}x'.format(jobs, elapsed, n / elapsed, serial / elapsed))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+
+"""Congruence benchmark for SeroTools.
+
+find_matches used to create a WKLMSerovar for every candidate row and to compare it
+with the query twice through SeroComp (reproduced below). It now compares the query
+with all candidates at once through congruence_levels, over the comparison arrays of
+the scheme. For queries with few to many candidates, the latency of both versions
+and of congruence_levels alone is reported, after checking that the matches agree.
+
+Usage:
+    $ python benchmarks/bench_congruence.py [repeats]
+"""
+
+import logging
+import sys
+import timeit
+from serotools import serotools as st
+
+
+queries = ['I 4,[5],12:i:1,2', 'I 4,12:b:–', 'I 1,4,[5],12:i:–', 'I 6,7:–:–', 'I 9,12:–:–',
+           'II 1,9,12:–:–', '4:–:–', 'I 3,10:–:–', 'I –:i:–', 'IIIb 61:–:–', ':–:1,2']
+
+
+def previous_find_matches(obj, indices):
+    """The comparisons of find_matches, as they were before congruence_levels."""
+
+    scheme = st.get_scheme()
+    wklm_objs = [st.WKLMSerovar(name) for name in [scheme.columns['Name'][i] for i in indices]]
+    dups = [wklm_obj.name.split(' or ') for wklm_obj in wklm_objs if ' or ' in wklm_obj.name]
+    dups = [item for sublist in dups for item in sublist]
+    return [st.SeroComp(obj, wklm_obj) for wklm_obj in wklm_objs
+            if wklm_obj.name not in dups and st.SeroComp(obj, wklm_obj).result != 'incongruent']
+
+
+def candidates(obj):
+    """The candidate rows of find_matches, i.e. those with any congruence level."""
+
+    levels = st.congruence_levels(obj)
+    return [i for i, level in enumerate(levels) if st.comparison_results[level] != 'incongruent']
+
+
+def main():
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    logging.disable(logging.CRITICAL)
+    st.get_scheme().comparison_arrays  # build the arrays before measuring
+
+    print('{:<20}{:>8}{:>8}{:>16}{:>16}{:>14}'.format('query', 'cands', 'matches', 'previous (ms)',
+                                                     'current (ms)', 'levels (ms)'))
+    for query in queries:
+        obj = st.input_to_wklm(query)
+        indices = candidates(obj)
+        previous = [(m.query.name, m.result) for m in previous_find_matches(obj, indices)]
+        current = [(m.query.name, m.result) for m in st.find_matches(obj)]
+        assert sorted(previous) == sorted(current), query
+
+        timings = [min(timeit.repeat(f, number=1, repeat=repeats)) * 1e3 for f in
+                   [lambda: previous_find_matches(obj, indices), lambda: st.find_matches(obj),
+                    lambda: st.congruence_levels(obj, indices)]]
+        print('{:<20}{:>8}{:>8}{:>16.2f}{:>16.2f}{:>14.3f}'.format(query, len(indices), len(current),
+                                                                  *timings))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+
+"""Disk cache benchmark for SeroTools.
+
+A file of distinct queries - repository names, formulas, partial formulas and merged
+serovar inputs - is queried without a disk cache, with an empty disk cache (first run)
+and with the disk cache filled by the first run (later runs). The in-memory caches are
+cleared before each run, as in a new process. The elapsed time and throughput of each
+run are reported, after checking that the output is the same.
+
+Usage:
+    $ python benchmarks/bench_disk_cache.py [n_queries]
+"""
+
+import contextlib
+import io
+import logging
+import os
+import random
+import sys
+import tempfile
+import time
+from serotools import serotools as st
+
+
+def queries_file(n, path, seed=0):
+    """Writes n distinct random queries to a file."""
+
+    scheme = st.get_scheme()
+    names = scheme.columns['Name']
+    formulas = [f for f in scheme.columns['Formula'] if isinstance(f, str)]
+    rnd = random.Random(seed)
+    pool = set(names + formulas + [f.rsplit(':', 1)[0] for f in formulas])
+    while len(pool) < n + len(names):
+        pool.add('{} or {}'.format(rnd.choice(names), rnd.choice(names)))
+    with open(path, 'w') as f:
+        for query in rnd.sample(sorted(pool), n):
+            f.write('{}\n'.format(query))
+
+
+def run(path):
+    """Returns the output of query and the elapsed time (s)."""
+
+    st.wklm_cache.clear()
+    st.comparison_cache.clear()
+    out = io.StringIO()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(out):
+        st.query(input_file=path)
+    return out.getvalue(), time.perf_counter() - start
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    logging.disable(logging.CRITICAL)
+    st.get_scheme().build_indexes()  # load the scheme before measuring
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path, db = os.path.join(tmp_dir, 'queries.txt'), os.path.join(tmp_dir, 'cache.db')
+        queries_file(n, path)
+
+        print('{} distinct queries'.format(n))
+        print('{:<16}{:>14}{:>18}'.format('disk cache', 'elapsed (s)', 'queries per s'))
+        expected, elapsed = run(path)
+        print('{:<16}{:>14.2f}{:>18.0f}'.format('none', elapsed, n / elapsed))
+        for label in ['empty', 'filled']:
+            st.open_disk_cache(db)
+            output, elapsed = run(path)
+            st.close_disk_cache()
+            assert output == expected, label
+            print('{:<16}{:>14.2f}{:>18.0f}'.format(label, elapsed, n / elapsed))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+
+"""Subset search benchmark for SeroTools.
+
+find_matches collects the rows of each antigen field whose factors are a proper subset
+of the input factors. It used to try every combination of the input factors in every
+order (reproduced below), which grows factorially with the number of factors. It now
+looks the factors of each row up in a canonical-key index (subset_indices).
+
+Adversarial formulas list n factors of the repository in each antigen field, with and
+without repeated factors. For each n, the latency of subset_indices over all fields and
+of the whole find_matches call are reported, together with the previous subset search
+while it stays within the time budget. Results of both searches are checked for
+equality.
+
+Usage:
+    $ python benchmarks/bench_find_matches.py [max_factors] [budget_s]
+"""
+
+import itertools
+import logging
+import random
+import sys
+import time
+import numpy as np
+from serotools import serotools as st
+
+
+def previous_subset_indices(factors, col):
+    """The subset search of find_matches, as it was before subset_indices."""
+
+    s_indices = set()
+    subsets = [list(itertools.combinations(factors, r)) for r in range(1, len(factors))]
+    for s in [item for sublist in subsets for item in sublist]:
+        all_matches = set()
+        s = sorted([int(i) if i.isdigit() else i for i in s], key=lambda x: (isinstance(x, str), x))
+        for p in itertools.permutations(s):
+            if len(all_matches):
+                break
+            all_matches = set(np.flatnonzero(col == ','.join(map(str, p))))
+            s_indices.update(all_matches)
+    return s_indices
+
+
+def formulas(n, seed=0):
+    """Returns two formulas with n factors per antigen field, the second repeating them."""
+
+    scheme = st.get_scheme()
+    rnd = random.Random(seed)
+    fields = []
+    for col in st.antigens[:3]:
+        vocab = sorted(f for f in scheme.factor_index(col) if f)
+        fields.append(rnd.sample(vocab, min(n, len(vocab))))
+    distinct = 'I ' + ':'.join(','.join(f) for f in fields)
+    repeated = 'I ' + ':'.join(','.join((f * 2)[:n]) for f in [f[:max(1, n // 2)] for f in fields])
+    return [('distinct', distinct), ('repeated', repeated)]
+
+
+def main():
+    max_n = int(sys.argv[1]) if len(sys.argv) > 1 else 24
+    budget = float(sys.argv[2]) if len(sys.argv) > 2 else 2.0
+    logging.disable(logging.CRITICAL)
+
+    scheme = st.get_scheme()
+    cols = {f: scheme.df[f].apply(st.prep) for f in st.antigens[:3]}
+    for f in cols:
+        scheme.factor_key_index(f)
+    previous_ok = True
+
+    print('{:>4}  {:<10}{:>16}{:>16}{:>18}'.format('n', 'factors', 'previous (ms)', 'current (ms)',
+                                                   'find_matches (ms)'))
+    for n in [2, 4, 6, 8, 10, 12, 16, 20, 24, 32, 48]:
+        if n > max_n:
+            break
+        for label, formula in formulas(n):
+            fields = st.formula_to_fields(formula)[1:4]
+            factors = [st.prep(field).split(',') for field in fields]
+
+            start = time.perf_counter()
+            current = [st.subset_indices(fs, scheme.factor_key_index(f)) for fs, f in zip(factors, cols)]
+            current_ms = (time.perf_counter() - start) * 1e3
+
+            previous_ms = float('nan')
+            if previous_ok:
+                start = time.perf_counter()
+                previous = [previous_subset_indices(fs, cols[f]) for fs, f in zip(factors, cols)]
+                previous_ms = (time.perf_counter() - start) * 1e3
+                assert previous == current, formula
+                previous_ok = previous_ms < budget * 1e3
+
+            obj = st.WKLMSerovar(formula)
+            start = time.perf_counter()
+            st.find_matches(obj)
+            matches_ms = (time.perf_counter() - start) * 1e3
+
+            print('{:>4}  {:<10}{:>16.2f}{:>16.2f}{:>18.2f}'.format(n, label, previous_ms, current_ms,
+                                                                   matches_ms))
+
+
+if __name__ == '__main__':
+    main()
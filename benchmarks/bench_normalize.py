@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+
+"""Normalization benchmark for SeroTools.
+
+Times each normalization function against the regex-per-call implementation it
+replaced (reproduced below), over the names, formulas and antigen fields of the WKLM
+repository. Results of both implementations are checked for equality before timing.
+
+Usage:
+    $ python benchmarks/bench_normalize.py [repeats]
+"""
+
+import re
+import sys
+import timeit
+import logging
+import pandas as pd
+from serotools import serotools as st
+
+
+#-------------------------------------------
+# Previous implementations
+#-------------------------------------------
+
+
+def prep(sero):
+    if pd.isna(sero):
+        return sero
+    standardize_unicode(sero)
+    sero = re.sub('}{', ',', sero)
+    sero = re.sub(r'\[|\]|\(|\)|{|}|\.{3}|…', '', sero)
+    return sero.lower()
+
+
+def standardize_unicode(string):
+    other_dashes = '[\u002D\u058A\u05BE\u1400\u1806\u2010\u2011\u2012\u2014\u2015\uFE58\uFE63\uFF0D\u02D7\u207B\u208B\u2212]'
+    string = re.sub(other_dashes,'\u2013',string)
+    return re.sub(r'\.{3}','…',string)
+
+
+def standardize_input(input):
+    if re.match('paratyphi b',input.lower()) and \
+        any(p in input.lower() for p in st.paratyphi_b_var):
+        input = 'Paratyphi B var. L(+) tartrate (= d–tartrate)+'
+    elif re.search(r'\(.+\)', input):
+        if not (re.search(r'[:|,]+\(.+\)', input)
+                or re.search(r'\(.+\)[:|,]+', input)):
+            input = re.sub(r'\(.+\)', '', input)
+    input = re.sub(r'\*|allmers','',input)
+    input = input.strip()
+    input = re.sub('^enterica','I',input,flags=re.IGNORECASE)
+    input = re.sub('^salamae','II',input,flags=re.IGNORECASE)
+    input = re.sub('^arizonae','IIIa',input,flags=re.IGNORECASE)
+    input = re.sub('^diarizonae','IIIb',input,flags=re.IGNORECASE)
+    input = re.sub('^houtenae','IV',input,flags=re.IGNORECASE)
+    input = re.sub('^bongori','V',input,flags=re.IGNORECASE)
+    input = re.sub('^indica','VI',input,flags=re.IGNORECASE)
+    input = re.sub(' Sdf prediction.+','',input,flags=re.IGNORECASE)
+    input = re.sub(' sdf.+','',input,flags=re.IGNORECASE)
+    if re.match('potential monophasic variant of', input.lower()):
+        if re.match('.+typhimurium',input.lower()):
+            input = 'I 4:i:–'
+        elif re.match('.+paratyphi b',input.lower()):
+            input = 'I 4:b:–'
+        elif re.match('.+heidelberg',input.lower()):
+            input = 'I 4:r:–'
+    return input
+
+
+def formula_to_fields(formula):
+    subsp = float('nan')
+    antigens_str = None
+    if formula.lower() in st.current_subsp:
+        subsp = formula.upper()
+    elif re.match(st.subsp_pattern, formula):
+        subsp, antigens_str = formula.split(' ')
+    elif re.match(st.no_subsp_pattern, formula):
+        antigens_str = formula
+    else:
+        raise st.InvalidInput(formula)
+    fields = [subsp] + [st.missing_antigen] * 3 + ['']
+    if antigens_str:
+        antigens_lst = antigens_str.split(':')
+        for i in range(0,4):
+            if i < len(antigens_lst) and antigens_lst[i]:
+                fields[i+1] = antigens_lst[i]
+    return fields
+
+
+def standardize_formula(formula):
+    formula = re.sub(':non-motile',':-:-',formula,flags=re.IGNORECASE)
+    formula = re.sub(':nonmotile',':-:-',formula,flags=re.IGNORECASE)
+    formula = re.sub('Rough:','-:',formula,flags=re.IGNORECASE)
+    formula = re.sub('Mucoid:','-:',formula,flags=re.IGNORECASE)
+    formula = re.sub('}{','},{',formula)
+    formula = standardize_unicode(formula)
+    subsp, O, P1, P2, other_H = formula_to_fields(formula)
+    other_missing = '(^$|undetermined|Undetermined)'
+    O = re.sub(other_missing,st.missing_antigen,O)
+    P1 = re.sub(other_missing,st.missing_antigen,P1)
+    P2 = re.sub(other_missing,st.missing_antigen,P2)
+    return st.fields_to_formula([subsp, O, P1, P2, other_H])
+
+
+def min_factors(factors):
+    factors = re.sub(r'\[.+?\],+?|\(.+?\),+?|{.+?},+?', '', factors)
+    factors = re.sub(r',+?\[.+?\]|,+?\(.+?\)|,+?{.+?}', '', factors)
+    factors = re.sub(r'\[.+?\]|\(.+?\)|{.+?}', '', factors)
+    factors = factors.split(',')
+    return set(factors) if factors[0] else set()
+
+
+def max_factors(factors):
+    factors = re.sub('}{', '},{', factors)
+    factors = re.sub(r'\[|\]|\(|\)|{|}', '', factors)
+    factors = factors.split(',')
+    return set(factors) if factors[0] else set()
+
+
+def is_opt_factor(factor,factors):
+    if not factors or pd.isna(factors):
+        return False
+    factor = prep(factor)
+    optional  = r'\[{}+?\]'.format(factor)
+    exclusive = r'\{{{}+?\}}|\{{{}+?|{}+?\}}'.format(factor,factor,factor)
+    weak = r'\({}+?\)'.format(factor)
+    any_pattern = '(' + optional + '|' + exclusive + '|' + weak + ')'
+    return bool(re.search(any_pattern, factors))
+
+
+#-------------------------------------------
+# Benchmark
+#-------------------------------------------
+
+
+def safe(f, *args):
+    try:
+        return f(*args)
+    except (st.InvalidInput, ValueError) as e:
+        return type(e)
+
+
+def cases():
+    scheme = st.get_scheme()
+    names, formulas = scheme.columns['Name'], scheme.columns['Formula']
+    fields = [f for col in st.antigens for f in scheme.columns[col]]
+    factor_pairs = [(f, field) for field in fields[::5] for f in st.max_factors(field.lower())]
+    return [
+        ('prep',                (prep, st.prep),                               [(v,) for v in names + formulas]),
+        ('standardize_unicode', (standardize_unicode, st.standardize_unicode), [(v,) for v in names + formulas]),
+        ('standardize_input',   (standardize_input, st.standardize_input),     [(v,) for v in names + formulas]),
+        ('standardize_formula', (standardize_formula, st.standardize_formula), [(v,) for v in formulas]),
+        ('formula_to_fields',   (formula_to_fields, st.formula_to_fields),     [(v,) for v in formulas]),
+        ('min_factors',         (min_factors, st.min_factors),                 [(v,) for v in fields]),
+        ('max_factors',         (max_factors, st.max_factors),                 [(v,) for v in fields]),
+        ('is_opt_factor',       (is_opt_factor, st.is_opt_factor),             factor_pairs),
+    ]
+
+
+def main():
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    logging.disable(logging.CRITICAL)
+
+    print('{:<22}{:>8}{:>16}{:>16}{:>10}'.format('function', 'calls', 'previous (us)', 'current (us)', 'speedup'))
+    for label, (previous, current), args in cases():
+        for a in args:
+            assert repr(safe(previous, *a)) == repr(safe(current, *a)), (label, a)
+        timings = []
+        for f in (previous, current):
+            t = min(timeit.repeat(lambda: [safe(f, *a) for a in args], number=1, repeat=repeats))
+            timings.append(t / len(args) * 1e6)
+        print('{:<22}{:>8}{:>16.2f}{:>16.2f}{:>9.1f}x'.format(label, len(args), timings[0], timings[1],
+                                                           timings[0] / timings[1]))
+
+
+if __name__ == '__main__':
+    main()
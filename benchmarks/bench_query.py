@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+
+"""Query scaling benchmark for SeroTools.
+
+query resolves each distinct query of an input file once, and with jobs > 1 resolves
+the distinct queries of each chunk of compare_chunk_size lines in a pool of processes.
+A file of random repository names, repository formulas, partial formulas and formulas
+which are not in the repository, with a given fraction of distinct lines, is queried
+with 1 to max_jobs processes; the elapsed time, throughput and speedup over one process
+are reported, after checking that the output is the same.
+
+Usage:
+    $ python benchmarks/bench_query.py [n_queries] [max_jobs] [distinct_fraction]
+"""
+
+import contextlib
+import io
+import logging
+import os
+import random
+import sys
+import tempfile
+import time
+from serotools import serotools as st
+
+
+def queries_file(n, path, distinct=0.5, seed=0):
+    """Writes n random queries, about a fraction distinct of them distinct, to a file."""
+
+    scheme = st.get_scheme()
+    formulas = [f for f in scheme.columns['Formula'] if isinstance(f, str)]
+    pool = scheme.columns['Name'][::3] + formulas[1::3] + \
+        [f.rsplit(':', 1)[0] for f in formulas[2::5]] + [f + ':[z99]' for f in formulas[2::9]]
+    rnd = random.Random(seed)
+    pool = rnd.sample(pool, min(len(pool), max(1, int(n * distinct))))
+    with open(path, 'w') as f:
+        for _ in range(n):
+            f.write('{}\n'.format(rnd.choice(pool)))
+
+
+def run(path, jobs):
+    """Returns the output of query and the elapsed time (s)."""
+
+    out = io.StringIO()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(out):
+        st.query(input_file=path, jobs=jobs)
+    return out.getvalue(), time.perf_counter() - start
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    max_jobs = int(sys.argv[2]) if len(sys.argv) > 2 else os.cpu_count()
+    distinct = float(sys.argv[3]) if len(sys.argv) > 3 else 0.5
+    logging.disable(logging.CRITICAL)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, 'queries.txt')
+        queries_file(n, path, distinct)
+
+        print('{} queries, {} cpus'.format(n, os.cpu_count()))
+        print('{:>6}{:>14}{:>18}{:>10}'.format('jobs', 'elapsed (s)', 'queries per s', 'speedup'))
+        for jobs in sorted(set([2 ** i for i in range(max_jobs.bit_length())] + [max_jobs])):
+            st.wklm_cache.clear()
+            st.comparison_cache.clear()
+            output, elapsed = run(path, jobs)
+            if jobs == 1:
+                expected, serial = output, elapsed
+            assert output == expected, jobs
+            print('{:>6}{:>14.2f}{:>18.0f}{:>9.1f}x'.format(jobs, elapsed, n / elapsed, serial / elapsed))
+
+
+if __name__ == '__main__':
+    main()
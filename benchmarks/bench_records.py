@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+
+"""Serovar record benchmark for SeroTools.
+
+Compares WKLMSerovar, which holds its metadata in a SerovarRecord, with the previous
+implementation, which held a pandas Series per object (reproduced below as
+SeriesSerovar). For each, the construction time and the memory retained by a list of
+objects are reported. Inputs cycle through repository names, repository formulas and
+formulas that are not in the repository.
+
+Usage:
+    $ python benchmarks/bench_records.py [n_objects]
+"""
+
+import itertools
+import logging
+import sys
+import time
+import tracemalloc
+import pandas as pd
+from serotools import serotools as st
+
+
+class SeriesSerovar(object):
+
+    """The Series-backed WKLMSerovar, as it was before SerovarRecord."""
+
+    def __init__(self,input):
+        self.input = st.standardize_unicode(input)
+        wklm_df = st.get_scheme().df
+        self.meta = pd.Series(dtype='object').reindex_like(wklm_df.iloc[0].squeeze())
+        input = st.prep(st.standardize_input(self.input))
+        if not wklm_df.loc[wklm_df.Std_Name == input].empty:
+            self.meta = wklm_df.loc[wklm_df.Std_Name == input].squeeze()
+        elif not wklm_df.loc[wklm_df.Std_Formula == input].empty:
+            self.meta = wklm_df.loc[wklm_df.Std_Formula == input].squeeze()
+            if isinstance(self.meta, pd.DataFrame):
+                self.meta = self.meta.iloc[-1]
+        if self.meta.isnull().values.all() and not st.is_name(input):
+            formula = st.standardize_input(self.input)
+            self.meta.Formula = formula
+            self.meta.Std_Formula = st.prep(formula)
+            self.meta.Subspecies, self.meta.O, self.meta.P1, \
+                self.meta.P2, self.meta.other_H = st.formula_to_fields(formula)
+        self.meta['Input'] = self.input
+        self.name = self.meta.Name
+        self.formula = self.meta.Formula
+
+
+def inputs(n):
+    scheme = st.get_scheme()
+    pool = [v for row in zip(scheme.columns['Name'][::7], scheme.columns['Formula'][::7],
+                             [f + ':[z99]' for f in scheme.columns['Formula'][3::7]]) for v in row]
+    return list(itertools.islice(itertools.cycle(pool), n))
+
+
+def measure(cls, values):
+    """Returns the construction time (s) and retained memory (bytes) for a list of objects."""
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    objs = [cls(v) for v in values]
+    elapsed = time.perf_counter() - start
+    retained = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del objs
+    return elapsed, retained
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    logging.disable(logging.CRITICAL)
+    values = inputs(n)
+    st.get_scheme().df  # load the scheme before measuring
+    st.WKLMSerovar(values[0]), SeriesSerovar(values[0])
+
+    print('{} objects'.format(n))
+    print('{:<16}{:>14}{:>14}{:>16}'.format('class', 'total (s)', 'per obj (us)', 'bytes per obj'))
+    for label, cls in [('SeriesSerovar', SeriesSerovar), ('WKLMSerovar', st.WKLMSerovar)]:
+        elapsed, retained = measure(cls, values)
+        print('{:<16}{:>14.3f}{:>14.1f}{:>16.0f}'.format(label, elapsed, elapsed / n * 1e6, retained / n))
+
+
+if __name__ == '__main__':
+    main()
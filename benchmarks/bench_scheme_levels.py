@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+
+"""Scheme comparison levels benchmark for SeroTools.
+
+The snapshot stores the comparison level of every pair of repository serovars (see
+scheme_comparison_levels), so that SeroComp, find_matches and SeroClust look up pairs of
+serovars which resolved to repository rows instead of comparing them. For random
+repository names, the latency of each is reported with the stored levels and without
+them (comparing as before), after checking that the results agree. The comparison cache
+is cleared before each measurement.
+
+Usage:
+    $ python benchmarks/bench_scheme_levels.py [n_names]
+"""
+
+import logging
+import random
+import sys
+import time
+import numpy as np
+from serotools import serotools as st
+
+
+def seroclust(objs):
+    return st.SeroClust('clust1', objs).levels
+
+
+def serocomp(objs):
+    return [st.SeroComp(s, q).result for s, q in zip(objs, objs[1:] + objs[:1])]
+
+
+def find_matches(objs):
+    return [sorted((m.query.name, m.result) for m in st.find_matches(obj)) for obj in objs]
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    logging.disable(logging.CRITICAL)
+    scheme = st.get_scheme()
+    scheme.build_indexes()  # load the scheme and its levels before measuring
+    levels = scheme.levels
+
+    names = random.Random(0).sample(scheme.columns['Name'], n)
+    objs = [st.WKLMSerovar(name) for name in names]
+
+    print('{} names'.format(n))
+    print('{:<14}{:>16}{:>16}{:>10}'.format('', 'compared (s)', 'looked up (s)', 'speedup'))
+    for f in (serocomp, find_matches, seroclust):
+        timings, results = [], []
+        for stored in (None, levels):
+            scheme.levels, scheme._comparison_levels = stored, None
+            scheme.comparison_levels
+            st.comparison_cache.clear()
+            start = time.perf_counter()
+            results.append(f(objs))
+            timings.append(time.perf_counter() - start)
+        assert np.array_equal(np.array(results[0], dtype=object), np.array(results[1], dtype=object)), f
+        print('{:<14}{:>16.3f}{:>16.3f}{:>9.1f}x'.format(f.__name__, timings[0], timings[1],
+                                                        timings[0] / timings[1]))
+
+
+if __name__ == '__main__':
+    main()
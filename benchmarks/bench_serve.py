@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+
+"""Server benchmark for SeroTools.
+
+Random repository names are queried one at a time by running the query subcommand in a
+new process, and by requests to a server started in this process (see server.py). The
+names are then queried by several concurrent clients, with and without micro-batching.
+The mean latency and throughput of each are reported, after checking that the rows are
+the same.
+
+Usage:
+    $ python benchmarks/bench_serve.py [n_queries] [n_clients]
+"""
+
+import concurrent.futures
+import logging
+import random
+import subprocess
+import sys
+import threading
+import time
+from serotools import serotools as st
+from serotools import server
+
+
+def run_cli(names):
+    rows = []
+    for name in names:
+        out = subprocess.run([sys.executable, '-m', 'serotools.cli', 'query', '-s', name],
+                             stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, check=True)
+        rows.extend(line.split('\t') for line in out.stdout.decode('utf-8').splitlines()[1:])
+    return rows
+
+
+def run_server(address, names, clients):
+    def send(name):
+        return server.request(address, '/query', {'serovars': [name]})[1]['rows']
+    with concurrent.futures.ThreadPoolExecutor(clients) as pool:
+        return [row for rows in pool.map(send, names) for row in rows]
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    clients = int(sys.argv[2]) if len(sys.argv) > 2 else 8
+    logging.disable(logging.CRITICAL)
+    names = random.Random(0).sample(st.get_scheme().columns['Name'], n)
+
+    print('{} queries'.format(n))
+    print('{:<26}{:>14}{:>18}'.format('', 'latency (ms)', 'queries per s'))
+    start = time.perf_counter()
+    expected = run_cli(names)
+    elapsed = time.perf_counter() - start
+    print('{:<26}{:>14.1f}{:>18.0f}'.format('new process per query', 1000 * elapsed / n, n / elapsed))
+    expected = [[None if v == 'NA' else v for v in row] for row in expected]
+
+    for label, wait, k in [('server, 1 client', 0, 1),
+                           ('server, {} clients'.format(clients), 0, clients),
+                           ('server, {} clients, batched'.format(clients), server.default_batch_wait, clients)]:
+        srv = server.SeroServer(('127.0.0.1', 0), batch_wait=wait)
+        threading.Thread(target=srv.serve_forever, daemon=True).start()
+        run_server(srv.address, names[:1], 1)  # warm up the connection path
+        srv.results.clear()
+        st.wklm_cache.clear()
+        start = time.perf_counter()
+        rows = run_server(srv.address, names, k)
+        elapsed = time.perf_counter() - start
+        srv.shutdown()
+        srv.close()
+        assert rows == expected, label
+        print('{:<26}{:>14.1f}{:>18.0f}'.format(label, 1000 * elapsed * k / n, n / elapsed))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+
+"""Startup benchmark for SeroTools.
+
+Measures the wall-clock time of fresh interpreter processes that import the package,
+run 'serotools --version', and then force the WKLM scheme to be loaded. The difference
+between the import and the load timings is the cost that is deferred until the scheme
+is first needed. Loading the binary snapshot is compared with evaluating the literals
+in wklm.py.
+
+Usage:
+    $ python benchmarks/bench_startup.py [repeats]
+"""
+
+import os
+import subprocess
+import sys
+import time
+
+
+cases = [
+    ('python (baseline)',             'pass'),
+    ('import serotools.serotools',    'import serotools.serotools'),
+    ('serotools --version',           'import sys; sys.argv = ["serotools", "--version"]; '
+                                      'from serotools import cli; cli.main()'),
+    ('load snapshot',                 'from serotools import snapshot; snapshot.load_snapshot()'),
+    ('import wklm.py literals',       'from serotools import wklm'),
+    ('import + get_scheme()',         'from serotools import serotools as st; st.get_scheme()'),
+    ('import + wklm_df',              'from serotools import serotools as st; st.wklm_df'),
+]
+
+
+def time_case(code, repeats):
+    """Returns the median wall-clock time (ms) of running code in a fresh interpreter."""
+
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ, PYTHONPATH=root)
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, '-c', code], env=env, check=True,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        timings.append((time.perf_counter() - start) * 1000)
+    timings.sort()
+    return timings[len(timings) // 2]
+
+
+def main():
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 11
+    print('{:<32}{:>12}'.format('case', 'median (ms)'))
+    for label, code in cases:
+        print('{:<32}{:>12.1f}'.format(label, time_case(code, repeats)))
+
+
+if __name__ == '__main__':
+    main()
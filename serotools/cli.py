@@ -4,6 +4,7 @@
 
 import argparse
 import logging
+import signal
 import sys
 
 from serotools import serotools as sero
@@ -35,31 +36,56 @@ def parse_arguments(system_args):
 
     formatter_class = argparse.ArgumentDefaultsHelpFormatter
 
+    # Cache options, shared by every subcommand
+    cache_parser = argparse.ArgumentParser(add_help=False)
+    cache_parser.add_argument("--cache-size",            dest="cache_size", type=int, default=sero.default_cache_size, help="Maximum number of serovar inputs to memoize. 0 disables the cache.")
+    cache_parser.add_argument("--comparison-cache-size", dest="comparison_cache_size", type=int, default=sero.default_comparison_cache_size, help="Maximum number of serovar pairs whose comparison results are memoized. 0 disables the cache.")
+    cache_parser.add_argument("--disk-cache",            dest="disk_cache", type=str, help="SQLite file in which the matches of serovars and merged serovar inputs are kept across runs. Created if missing; entries of other versions of the scheme are ignored.")
+    cache_parser.add_argument("--disk-cache-size",       dest="disk_cache_size", type=int, default=sero.default_max_entries, help="Maximum number of entries kept in the disk cache. The least recently used are pruned when the command ends.")
+    cache_parser.add_argument("--disk-cache-max-age",    dest="disk_cache_max_age", type=float, help="Prune disk cache entries which have not been used for this many days when the command ends.")
+    cache_parser.add_argument("--disk-cache-prune-versions", dest="disk_cache_prune_versions", action="store_true", help="Remove the disk cache entries of other versions of the scheme when the command ends. Other installations sharing the file lose their entries.")
+
     help_str = """Query the WKL database with one or more serovar names or antigenic formulas."""
     description = help_str
-    subparser = subparsers.add_parser("query", formatter_class=formatter_class, description=description, help=help_str)
+    subparser = subparsers.add_parser("query", parents=[cache_parser], formatter_class=formatter_class, description=description, help=help_str)
     subparser.add_argument("-i", "--input",   dest="in_file", type=str,            help="Specify an input file with one query (serovar or antigenic formula) per line.")
     subparser.add_argument("-s", "--serovar", dest="serovar", type=str,            help="Specify a query (serovar name or antigenic formula).")
     subparser.add_argument("-e", "--exact",   dest="exact",   action="store_true", help="Find exact matches only.")
+    subparser.add_argument("-j", "--jobs",    dest="jobs",    type=int, default=1, help="Number of processes resolving the distinct queries of an input file. Output is the same as with one process.")
     subparser.set_defaults(func=query_command)
 
     help_str = "Compare one of more pairs of serovars for congruency."
     description = help_str
-    subparser = subparsers.add_parser("compare", formatter_class=formatter_class, description=description, help=help_str)
+    subparser = subparsers.add_parser("compare", parents=[cache_parser], formatter_class=formatter_class, description=description, help=help_str)
     subparser.add_argument(      "--header",dest="header",  action="store_true",  help="The input file includes a header line.")
     subparser.add_argument("-i", "--input", dest="in_file", type=str,             help="Specify a tab-delimited input file with two columns of serovars for comparison.")
     subparser.add_argument("-1", "--subj",  dest="subj",    type=str,             help="Specify the first serovar for comparison.")
     subparser.add_argument("-2", "--query", dest="query",   type=str,             help="Specify the second serovar for comparison.")
+    subparser.add_argument("-j", "--jobs",  dest="jobs",    type=int, default=1,  help="Number of processes comparing chunks of the input file. Output is the same as with one process.")
     subparser.set_defaults(func=compare_command)
 
     help_str = """Determine the most abundant serovar(s) for one or more clusters of isolates."""
     description = help_str
-    subparser = subparsers.add_parser("cluster", formatter_class=formatter_class, description=description, help=help_str)
+    subparser = subparsers.add_parser("cluster", parents=[cache_parser], formatter_class=formatter_class, description=description, help=help_str)
     subparser.add_argument("-i", "--input",     dest="in_file", type=str, help="Specify a tab-delimited input file in which each line contains two fields: a cluster id and a serovar designation, respectively.")
     subparser.add_argument("-s", "--sortby",    dest="sort_by", type=str, help="One or more comma-delim options for ordered sort results. Options = m (min_con), c (congruent), e (exact), i (init). Default = c,e,i.")                               
     subparser.add_argument("-v", "--verbosity", dest="v",       type=int, help="Verbosity of output. 1 - serovar info. 2 - serovar and abundance. 3 - all metrics.")
+    subparser.add_argument("--grouped",         dest="grouped", action="store_true", help="The lines of each cluster are consecutive in the input file. Each cluster is printed as soon as it ends, holding one cluster in memory at a time.")
+    subparser.add_argument("--partitions",      dest="partitions", type=int, default=0, help="Split the input by cluster ID into this many temporary files and evaluate them one at a time, holding one partition in memory at a time. 0 reads the whole input into memory.")
+    subparser.add_argument("--order",           dest="order",   type=str, default="first-seen", choices=sero.cluster_orders, help="Order of clusters in the output: as first seen in the input, or sorted by cluster ID.")
+    subparser.add_argument("-j", "--jobs",      dest="jobs",    type=int, default=1, help="Number of processes evaluating clusters. Output is the same as with one process.")
     subparser.set_defaults(func=cluster_command)
 
+    help_str = """Serve query, compare and cluster requests as JSON over HTTP, keeping the WKL database and caches loaded."""
+    description = help_str
+    subparser = subparsers.add_parser("serve", parents=[cache_parser], formatter_class=formatter_class, description=description, help=help_str)
+    subparser.add_argument(      "--host",        dest="host",   type=str, help="Address to listen on.")
+    subparser.add_argument("-p", "--port",        dest="port",   type=int, help="TCP port to listen on. 0 picks a free port.")
+    subparser.add_argument(      "--socket",      dest="socket", type=str, help="Listen on this Unix domain socket instead of a TCP port.")
+    subparser.add_argument(      "--batch-size",  dest="batch_size", type=int, help="Maximum number of requests handled in one batch.")
+    subparser.add_argument(      "--batch-wait",  dest="batch_wait", type=float, help="Seconds a batch waits for further requests after its first request. 0 batches only requests which are already waiting.")
+    subparser.set_defaults(func=serve_command)
+
     args = parser.parse_args(system_args)
     return args
 
@@ -74,7 +100,12 @@ def cluster_command(args):
         parsed from sys.argv, but can be set programmatically for unit testing
         or other purposes.
     """
-    sero.cluster(args.in_file, args.sort_by, args.v)
+    set_caches(args)
+    try:
+        sero.cluster(args.in_file, args.sort_by, args.v, args.grouped, args.partitions, args.order, 
+                     args.jobs)
+    finally:
+        sero.close_disk_cache(args.disk_cache_prune_versions)
 
 
 def compare_command(args):
@@ -86,7 +117,11 @@ def compare_command(args):
         parsed from sys.argv, but can be set programmatically for unit testing
         or other purposes.
     """
-    sero.compare(args.in_file, args.subj, args.query, args.header)
+    set_caches(args)
+    try:
+        sero.compare(args.in_file, args.subj, args.query, args.header, args.jobs)
+    finally:
+        sero.close_disk_cache(args.disk_cache_prune_versions)
 
 
 def query_command(args):
@@ -97,7 +132,55 @@ def query_command(args):
         parsed from sys.argv, but can be set programmatically for unit testing
         or other purposes.
     """
-    sero.query(args.in_file, args.serovar, args.exact)
+    set_caches(args)
+    try:
+        sero.query(args.in_file, args.serovar, args.exact, args.jobs)
+    finally:
+        sero.close_disk_cache(args.disk_cache_prune_versions)
+
+
+def serve_command(args):
+    """Serve query, compare and cluster requests until interrupted or terminated.
+    Parameters
+    ----------
+    args : Namespace
+        Command line arguments stored as attributes of a Namespace, usually
+        parsed from sys.argv, but can be set programmatically for unit testing
+        or other purposes.
+    """
+    # Imported here, as the HTTP modules are not needed by the other subcommands
+    from serotools import server
+    defaults = {'host': server.default_host, 'port': server.default_port, 
+                'batch_size': server.default_batch_size, 'batch_wait': server.default_batch_wait}
+    for option, default in defaults.items():
+        if getattr(args, option) is None:
+            setattr(args, option, default)
+    set_caches(args)
+    try:
+        httpd = server.SeroServer(args.socket or (args.host, args.port), args.batch_size, args.batch_wait)
+        signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+        logging.info("Serving SeroTools on {}".format(httpd.address if args.socket else "http://{}:{}".format(*httpd.address)))
+        try:
+            httpd.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            httpd.close()
+    finally:
+        sero.close_disk_cache(args.disk_cache_prune_versions)
+
+
+def set_caches(args):
+    """Size the serovar and comparison caches, and open the disk cache, if any, for a 
+       subcommand.
+    Parameters
+    ----------
+    args : Namespace
+        Command line arguments stored as attributes of a Namespace.
+    """
+    sero.resize_caches(args.cache_size, args.comparison_cache_size)
+    if args.disk_cache:
+        sero.open_disk_cache(args.disk_cache, args.disk_cache_size, args.disk_cache_max_age)
 
 
 def run_command_from_args(args):
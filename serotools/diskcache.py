@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+
+"""Persistent cache of SeroTools results.
+
+Results which are expensive to compute - the matches of a serovar (find_matches) and
+serovar inputs resolved by merging several serovars (input_to_wklm) - are stored in a
+SQLite database, so that later runs reuse them. Cheaper results, such as single
+serovars and the comparison levels of pairs, are recomputed faster than they are read,
+and are only cached in memory.
+
+Entries are keyed by kind, key and version. The version is a digest of the repository
+data and the comparison rules (see WKLMScheme.version), so that entries stored for
+another version of the scheme are never read. Several versions - e.g. two installations,
+or a checkout next to an installed copy - may share a database: entries of other versions
+are only removed on request (prune(other_versions=True)), and otherwise age out as the
+least recently used. The database
+uses write-ahead logging, so that any number of processes may read it while another
+writes. Writes, and the times at which entries are used, are buffered and written in
+one transaction per flush.
+
+Use with:
+    $ serotools query -i queries.txt --disk-cache serotools.db
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+
+# Maximum number of entries kept by prune()
+default_max_entries = 1000000
+
+# Number of buffered writes which triggers a flush
+flush_size = 1000
+
+# Seconds a connection waits for another process to finish writing
+busy_timeout = 30
+
+schema = ["CREATE TABLE IF NOT EXISTS entries (version TEXT NOT NULL, kind TEXT NOT NULL, "
+          "key TEXT NOT NULL, value TEXT NOT NULL, used REAL NOT NULL, PRIMARY KEY (version, kind, key))",
+          "CREATE INDEX IF NOT EXISTS entries_used ON entries (used)"]
+
+
+class DiskCache(object):
+
+    def __init__(self,path,version,max_entries=default_max_entries,max_age=None):
+
+        """A persistent cache of JSON values, stored in a SQLite database. Each process
+           opens its own connection, so a cache may be shared with forked processes.
+        Args:
+            path(str):          the database file, created if missing
+            version(str):       the version of the entries read and written
+            max_entries(int):   the maximum number of entries of all versions kept by
+                                prune()
+            max_age(float):     days after which entries which have not been used are
+                                removed by prune() (None keeps them)
+        Attributes:
+            The input arguments are stored as attributes.
+            hits(int):          the number of lookups which found an entry
+            misses(int):        the number of lookups which did not find an entry
+        Functions:
+            get():   retrieve a value
+            put():   add a value, written on the next flush
+            flush(): write buffered values and use times
+            prune(): remove old entries and entries over max_entries, least recently
+                     used first, and optionally the entries of other versions
+            close(): flush, optionally prune, and close the connection
+            info():  cache statistics
+        """
+
+        self.path = path
+        self.version = version
+        self.max_entries = max_entries
+        self.max_age = max_age
+        self.hits = 0
+        self.misses = 0
+        self._pending = {}
+        self._used = set()
+        self._conn = None
+        self._pid = None
+        self._lock = threading.Lock()
+        self._connection()
+
+
+    def _connection(self):
+        # A connection inherited from another process is abandoned, with its buffers
+        if self._pid != os.getpid():
+            self._conn = sqlite3.connect(self.path, timeout=busy_timeout, check_same_thread=False,
+                                         isolation_level=None)
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            for statement in schema:
+                self._conn.execute(statement)
+            self._pid = os.getpid()
+            self._pending, self._used = {}, set()
+        return self._conn
+
+
+    def get(self,kind,key,default=None):
+        k = json.dumps(key, ensure_ascii=False)
+        with self._lock:
+            value = self._pending.get((kind, k))
+            if value is None:
+                row = self._connection().execute(
+                    'SELECT value FROM entries WHERE version = ? AND kind = ? AND key = ?',
+                    (self.version, kind, k)).fetchone()
+                value = row[0] if row is not None else None
+                if value is not None:
+                    self._used.add((kind, k))
+            if value is None:
+                self.misses += 1
+                return default
+            self.hits += 1
+        return json.loads(value)
+
+
+    def put(self,kind,key,value):
+        with self._lock:
+            self._connection()
+            self._pending[(kind, json.dumps(key, ensure_ascii=False))] = json.dumps(value, ensure_ascii=False)
+            full = len(self._pending) + len(self._used) >= flush_size
+        if full:
+            self.flush()
+
+
+    def flush(self):
+        with self._lock:
+            conn = self._connection()
+            if not self._pending and not self._used:
+                return
+            now = time.time()
+            try:
+                conn.execute('BEGIN IMMEDIATE')
+                conn.executemany('INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?)',
+                                 [(self.version, kind, k, v, now) for (kind, k), v in self._pending.items()])
+                conn.executemany('UPDATE entries SET used = ? WHERE version = ? AND kind = ? AND key = ?',
+                                 [(now, self.version, kind, k) for kind, k in self._used])
+                conn.execute('COMMIT')
+            except sqlite3.Error as e:
+                if conn.in_transaction:
+                    conn.execute('ROLLBACK')
+                logging.warning('The disk cache {} was not updated ({}).'.format(self.path, e))
+            # The cache is best effort - entries which could not be written are dropped
+            self._pending, self._used = {}, set()
+
+
+    def prune(self,other_versions=False):
+        """Removes entries unused for more than max_age days and the least recently used
+           entries over max_entries, of any version.
+        Args:
+            other_versions(bool): also remove every entry of another version
+        Returns:
+            (int): The number of entries removed.
+        """
+
+        self.flush()
+        with self._lock:
+            conn = self._connection()
+            try:
+                conn.execute('BEGIN IMMEDIATE')
+                removed = 0
+                if other_versions:
+                    removed += conn.execute('DELETE FROM entries WHERE version != ?', (self.version,)).rowcount
+                if self.max_age is not None:
+                    removed += conn.execute('DELETE FROM entries WHERE used < ?',
+                                            (time.time() - self.max_age * 86400,)).rowcount
+                excess = conn.execute('SELECT COUNT(*) FROM entries').fetchone()[0] - max(self.max_entries, 0)
+                if excess > 0:
+                    removed += conn.execute('DELETE FROM entries WHERE rowid IN (SELECT rowid FROM entries '
+                                            'ORDER BY used LIMIT ?)', (excess,)).rowcount
+                conn.execute('COMMIT')
+            except sqlite3.Error as e:
+                if conn.in_transaction:
+                    conn.execute('ROLLBACK')
+                logging.warning('The disk cache {} was not pruned ({}).'.format(self.path, e))
+                return 0
+        return removed
+
+
+    def close(self,prune=True,other_versions=False):
+        if prune:
+            self.prune(other_versions)
+        else:
+            self.flush()
+        with self._lock:
+            if self._conn is not None and self._pid == os.getpid():
+                self._conn.close()
+            self._conn, self._pid = None, None
+
+
+    def info(self):
+        """Returns a dict of cache statistics - hits, misses, max_entries and size."""
+        with self._lock:
+            size = self._connection().execute('SELECT COUNT(*) FROM entries WHERE version = ?',
+                                              (self.version,)).fetchone()[0]
+            return {'hits': self.hits, 'misses': self.misses,
+                    'max_entries': self.max_entries, 'size': size}
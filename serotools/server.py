@@ -0,0 +1,496 @@
+#!/usr/bin/env python3
+
+"""Long-running SeroTools server.
+
+The server loads the WKLM repository, its indexes and comparison levels once, keeps the
+serovar, comparison and query caches warm between requests, and answers query, compare
+and cluster requests with JSON over HTTP, on a local TCP port or a Unix domain socket.
+A pipeline which makes many small calls does not pay the start-up of a process for each.
+
+Requests are handled by one thread, in micro-batches: the requests which arrive while a
+batch is handled, or within batch_wait seconds of its first request, are handled as the
+next batch. The distinct queries of a batch are resolved once, and the disk cache, if
+open, is written once per batch. Results are the same as those of the subcommands.
+
+Endpoints:
+    GET  /health    status, versions, uptime, and request and cache statistics
+    POST /query     {"serovars": ["Paratyphi A", ...], "exact": false}
+    POST /compare   {"pairs": [["Hull", "I 16:b:1,2"], ...]}
+    POST /cluster   {"clusters": [["cluster1", ["Dunkwa", "Utah"]], ...],
+                     "sort_by": "c,e,m", "verbosity": 2}
+    POST /reload    load updated repository data (see reload_scheme)
+
+Responses hold the 'columns' and 'rows' printed by the subcommand, with missing values
+as null, and the 'messages' logged while handling the request. A request which cannot
+be answered gets a 4xx status and {"error": message}.
+
+Use with:
+    $ serotools serve --port 8080
+    $ curl -s localhost:8080/query -d '{"serovars": ["Paratyphi A"]}'
+"""
+
+import concurrent.futures
+import http.client
+import http.server
+import json
+import logging
+import os
+import queue
+import socket
+import socketserver
+import stat
+import threading
+import time
+import numpy as np
+import pandas as pd
+from serotools import __version__
+from serotools import serotools as sero
+
+default_host = '127.0.0.1'
+default_port = 8080
+
+# Maximum number of requests handled in one batch
+default_batch_size = 256
+
+# Seconds a batch waits for further requests after its first request
+default_batch_wait = 0.002
+
+# Maximum size of a request body, in bytes
+max_body_size = 64 * 1024 * 1024
+
+request_kinds = ['query', 'compare', 'cluster', 'reload']
+cluster_sort_options = ['e', 'c', 'm']
+query_columns = ['Input', 'Name', 'Formula', 'Match']
+compare_columns = ['Serovar1', 'Name', 'Formula', 'Serovar2', 'Name', 'Formula', 'Result']
+
+
+class Batcher(object):
+
+    def __init__(self,handle,max_size=default_batch_size,max_wait=default_batch_wait):
+
+        """Collects the items submitted by concurrent threads into batches, which a single
+           thread hands to a function in the order submitted.
+        Args:
+            handle(function):  takes a list of items and returns a list of their results
+            max_size(int):     the maximum number of items in a batch
+            max_wait(float):   seconds a batch waits for further items after its first;
+                               0 takes only the items already waiting
+        Attributes:
+            The input arguments are stored as attributes.
+            items(int):        the number of items handled
+            batches(int):      the number of batches handled
+            max_batch(int):    the number of items in the largest batch
+        Functions:
+            submit(): hand an item to the batch thread and wait for its result
+            pending(): the number of items waiting for a batch
+            close():  stop the batch thread once the items submitted are handled
+        """
+
+        self.handle = handle
+        self.max_size = max_size
+        self.max_wait = max_wait
+        self.items = 0
+        self.batches = 0
+        self.max_batch = 0
+        self._queue = queue.Queue()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name='serotools-batcher', daemon=True)
+        self._thread.start()
+
+
+    def submit(self,item):
+        if self._closed:
+            raise RuntimeError('The batcher is closed.')
+        future = concurrent.futures.Future()
+        self._queue.put((item, future))
+        return future.result()
+
+
+    def pending(self):
+        return self._queue.qsize()
+
+
+    def close(self):
+        if not self._closed:
+            self._closed = True
+            self._queue.put(None)
+            self._thread.join()
+
+
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.max_wait
+            while batch[-1] is not None and len(batch) < self.max_size:
+                try:
+                    batch.append(self._queue.get(timeout=max(deadline - time.monotonic(), 0)))
+                except queue.Empty:
+                    break
+            stop = batch[-1] is None
+            if stop:
+                batch.pop()
+            if batch:
+                self._handle(batch)
+            if stop:
+                return
+
+
+    def _handle(self,batch):
+        try:
+            results = self.handle([item for item, _ in batch])
+        except Exception as e:
+            for _, future in batch:
+                future.set_exception(e)
+        else:
+            for (_, future), result in zip(batch, results):
+                future.set_result(result)
+        self.items += len(batch)
+        self.batches += 1
+        self.max_batch = max(self.max_batch, len(batch))
+
+
+class RequestError(Exception):
+    """Raised for a request which is not valid, with the HTTP status of its response."""
+
+    def __init__(self,message,status=400):
+        super().__init__(message)
+        self.status = status
+
+
+class RequestHandler(http.server.BaseHTTPRequestHandler):
+
+    """Reads JSON requests, submits them to the SeroServer of the HTTP server, and writes
+       JSON responses."""
+
+    protocol_version = 'HTTP/1.1'
+    server_version = 'SeroTools/' + __version__
+
+
+    def do_GET(self):
+        if self.path == '/health':
+            self.respond(200, self.server.sero.health())
+        else:
+            self.respond(404, {'error': 'Unknown endpoint {}.'.format(self.path)})
+
+
+    def do_POST(self):
+        kind = self.path.strip('/')
+        try:
+            length = int(self.headers.get('Content-Length') or 0)
+        except ValueError:
+            length = -1
+        if length < 0:
+            # The length of the body is not known, so the connection cannot be reused
+            self.close_connection = True
+            self.respond(400, {'error': 'The Content-Length header is not valid.'})
+            return
+        if length > max_body_size:
+            # The body is not read, so the connection cannot be reused
+            self.close_connection = True
+            self.respond(413, {'error': 'The request is larger than {} bytes.'.format(max_body_size)})
+            return
+        data = self.rfile.read(length)
+        if kind not in request_kinds:
+            status, body = 404, {'error': 'Unknown endpoint {}.'.format(self.path)}
+        else:
+            try:
+                payload = json.loads(data.decode('utf-8') or '{}')
+            except ValueError as e:
+                status, body = 400, {'error': 'The request is not valid JSON ({}).'.format(e)}
+            else:
+                status, body = self.server.sero.submit(kind, payload)
+        self.respond(status, body)
+
+
+    def respond(self,status,body):
+        data = json.dumps(body, ensure_ascii=False, allow_nan=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+    def log_message(self,format,*args):
+        logging.debug('serve: ' + format % args)
+
+
+class SeroServer(object):
+
+    def __init__(self,address=(default_host, default_port),batch_size=default_batch_size,
+                 batch_wait=default_batch_wait):
+
+        """Serves query, compare and cluster requests (see the module docstring). The
+           scheme, its indexes and comparison levels are loaded before listening.
+        Args:
+            address(tuple or str): a (host, port) to listen on (port 0 picks a free port),
+                                   or the path of a Unix domain socket, which replaces
+                                   an existing socket file
+            batch_size(int):       see Batcher
+            batch_wait(float):     see Batcher
+        Attributes:
+            address:               the address listened on
+            batcher(Batcher):      the micro-batches of requests
+            results(LRUCache):     the resolved queries (see resolve_query), keyed by
+                                   query and exact, of the size of wklm_cache
+            scheme_version(str):   see WKLMScheme.version
+            started(float):        the time the server started
+        Functions:
+            serve_forever(): handle requests until shutdown() is called
+            shutdown():      stop serve_forever(), e.g. from another thread
+            close():         stop listening and handling requests
+            submit():        handle a request in the next batch, as (status, body)
+            health():        server status and statistics
+        """
+
+        scheme = sero.get_scheme()
+        scheme.build_indexes()
+        self.scheme_version = scheme.version
+        self.results = sero.LRUCache(sero.wklm_cache.maxsize)
+        self.started = time.time()
+        if isinstance(address, str):
+            if os.path.exists(address) and stat.S_ISSOCK(os.stat(address).st_mode):
+                os.unlink(address)
+            self.httpd = UnixHTTPServer(address, RequestHandler)
+            self.address = address
+        else:
+            self.httpd = http.server.ThreadingHTTPServer(address, RequestHandler)
+            self.address = self.httpd.server_address[:2]
+        self.httpd.sero = self
+        self.batcher = Batcher(self.handle_batch, batch_size, batch_wait)
+
+
+    def serve_forever(self):
+        self.httpd.serve_forever()
+
+
+    def shutdown(self):
+        self.httpd.shutdown()
+
+
+    def close(self):
+        self.httpd.server_close()
+        self.batcher.close()
+        if isinstance(self.address, str) and os.path.exists(self.address):
+            os.unlink(self.address)
+
+
+    def submit(self,kind,payload):
+        return self.batcher.submit((kind, payload))
+
+
+    def health(self):
+        disk_cache = sero.disk_cache
+        return {'status': 'ok',
+                'version': __version__,
+                'scheme_version': self.scheme_version,
+                'uptime': round(time.time() - self.started, 3),
+                'requests': self.batcher.items,
+                'batches': self.batcher.batches,
+                'max_batch': self.batcher.max_batch,
+                'pending': self.batcher.pending(),
+                'caches': {
+                    'serovars': {'size': len(sero.wklm_cache), 'max_size': sero.wklm_cache.maxsize},
+                    'comparisons': {'size': len(sero.comparison_cache),
+                                    'max_size': sero.comparison_cache.maxsize},
+                    'queries': {'size': len(self.results), 'max_size': self.results.maxsize},
+                    'disk': None if disk_cache is None else
+                            {'path': disk_cache.path, 'hits': disk_cache.hits, 'misses': disk_cache.misses}}}
+
+
+    def handle_batch(self,requests):
+        """Handles a batch of (kind, payload) requests in order.
+        Returns:
+            (list): per request, the HTTP status and the body of its response
+        """
+
+        resolved = {}
+        responses = []
+        for kind, payload in requests:
+            try:
+                if not isinstance(payload, dict):
+                    raise RequestError('The request must be a JSON object.')
+                if kind == 'query':
+                    body = self.query(payload, resolved)
+                elif kind == 'compare':
+                    body = self.compare(payload)
+                elif kind == 'cluster':
+                    body = self.cluster(payload)
+                else:
+                    body = self.reload()
+                    resolved = {}
+                responses.append((200, body))
+            except RequestError as e:
+                responses.append((e.status, {'error': str(e)}))
+            except Exception as e:
+                # Raised by serotools for input it cannot process
+                responses.append((422, {'error': '{}: {}'.format(type(e).__name__, e)}))
+        if sero.disk_cache is not None:
+            sero.disk_cache.flush()
+        return responses
+
+
+    def query(self,payload,resolved):
+        """Queries the WKLM repository for each serovar, as query_results would, resolving
+           each distinct query of the batch once.
+        Args:
+            payload(dict):  serovars(list) and exact(bool)
+            resolved(dict): the queries resolved in the batch, including errors
+        """
+
+        serovars = _list_field(payload, 'serovars', str)
+        exact = bool(payload.get('exact', False))
+        rows, messages = [], []
+        for serovar in serovars:
+            if not len(serovar.strip()):
+                continue
+            key = (serovar.rstrip(), exact)
+            result = resolved.get(key) or self.results.get(key)
+            if result is None:
+                result = sero.resolve_query(*key)
+                if result[2] is None:
+                    self.results.put(key, result)
+            resolved[key] = result
+            q_rows, q_messages, error = result
+            messages.extend(q_messages)
+            if error is not None:
+                raise error
+            rows.extend(q_rows)
+        return _table(query_columns, rows, messages)
+
+
+    def compare(self,payload):
+        """Compares pairs of serovars, as comparison_rows would.
+        Args:
+            payload(dict): pairs(list) of [serovar1, serovar2] lists
+        """
+
+        pairs = _list_field(payload, 'pairs', list)
+        if not all(len(pair) == 2 and all(isinstance(s, str) for s in pair) for pair in pairs):
+            raise RequestError("'pairs' must be a list of [serovar1, serovar2] lists.")
+        with sero.LogCapture() as log:
+            rows = [sero.SeroComp(sero.input_to_wklm(subj), sero.input_to_wklm(query)).row()
+                    for subj, query in pairs]
+        return _table(compare_columns, rows, log.messages)
+
+
+    def cluster(self,payload):
+        """Determines the most abundant serovar(s) of each cluster, as cluster would.
+        Args:
+            payload(dict): clusters(list) of [cluster id, serovars] lists, or a dict of
+                           serovars by cluster id; sort_by(str or list) and verbosity(int)
+                           as in cluster
+        """
+
+        clusters = payload.get('clusters')
+        if isinstance(clusters, dict):
+            clusters = [[k, serovars] for k, serovars in clusters.items()]
+        clusters = _list_field({'clusters': clusters}, 'clusters', list)
+        if not clusters or not all(len(c) == 2 and isinstance(c[1], list) and all(isinstance(s, str) for s in c[1])
+                   for c in clusters):
+            raise RequestError("'clusters' must be a non-empty list of [cluster id, serovars] lists.")
+        sort_by = payload.get('sort_by')
+        if isinstance(sort_by, str):
+            sort_by = sort_by.split(',') if sort_by else None
+        if sort_by is not None and (not isinstance(sort_by, list) or 
+                                    not all(s in cluster_sort_options for s in sort_by)):
+            raise RequestError("'sort_by' must list one or more of {}.".format(', '.join(cluster_sort_options)))
+        v = payload.get('verbosity')
+        if v not in [None, 1, 2, 3]:
+            raise RequestError("'verbosity' must be 1, 2 or 3.")
+        with sero.LogCapture() as log:
+            tables = [sero.SeroClust(k, [sero.input_to_wklm(s) for s in serovars], sort_by=sort_by).table(v)
+                      for k, serovars in clusters]
+        df = pd.concat(tables)
+        return _table(df.columns, df.values.tolist(), log.messages)
+
+
+    def reload(self):
+        """Loads updated repository data (see reload_scheme), and discards the resolved
+           queries."""
+
+        previous = self.scheme_version
+        scheme = sero.reload_scheme()
+        scheme.build_indexes()
+        self.results.clear()
+        self.scheme_version = scheme.version
+        logging.info('Reloaded the WKLM repository (version {}).'.format(scheme.version))
+        return {'status': 'reloaded', 'scheme_version': scheme.version,
+                'previous_version': previous}
+
+
+class UnixHTTPConnection(http.client.HTTPConnection):
+
+    """An HTTP client connection to a Unix domain socket."""
+
+    def __init__(self,path,timeout=None):
+        super().__init__('localhost', timeout=timeout)
+        self.socket_path = path
+
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(self.timeout)
+        self.sock.connect(self.socket_path)
+
+
+class UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+
+    """An HTTP server listening on a Unix domain socket, with a thread per connection."""
+
+    daemon_threads = True
+
+    def get_request(self):
+        # BaseHTTPRequestHandler expects a (host, port) client address
+        request, _ = super().get_request()
+        return request, ('local', 0)
+
+
+def request(address, path, payload=None, timeout=None):
+    """Sends a request to a server, e.g. from a pipeline or a test.
+    Args:
+        address(tuple or str): a (host, port), or the path of a Unix domain socket
+        path(str):             the endpoint, e.g. '/query'
+        payload(dict):         the JSON body of a POST request; None sends a GET request
+        timeout(float):        seconds to wait for the server. Default: no timeout
+    Returns:
+        (tuple): the HTTP status and the JSON body of the response
+    """
+
+    if isinstance(address, str):
+        conn = UnixHTTPConnection(address, timeout)
+    else:
+        conn = http.client.HTTPConnection(address[0], address[1], timeout=timeout)
+    try:
+        if payload is None:
+            conn.request('GET', path)
+        else:
+            conn.request('POST', path, json.dumps(payload).encode('utf-8'),
+                         {'Content-Type': 'application/json'})
+        response = conn.getresponse()
+        return response.status, json.loads(response.read().decode('utf-8'))
+    finally:
+        conn.close()
+
+
+def _list_field(payload, name, item_type):
+    value = payload.get(name)
+    if not isinstance(value, list) or not all(isinstance(v, item_type) for v in value):
+        raise RequestError("'{}' must be a list of {}.".format(name,
+                           'strings' if item_type is str else 'lists'))
+    return value
+
+
+def _table(columns, rows, messages):
+    return {'columns': list(columns),
+            'rows': [[_json_value(v) for v in row] for row in rows],
+            'messages': [{'level': logging.getLevelName(level), 'message': message}
+                         for level, message in messages]}
+
+
+def _json_value(v):
+    if isinstance(v, np.generic):
+        v = v.item()
+    if v is None or (isinstance(v, float) and v != v):
+        return None
+    return v
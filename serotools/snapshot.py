@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+
+"""Binary snapshot of the WKLM repository.
+
+The snapshot is a single file holding the repository columns, the lookup dictionaries
+and the comparison levels between every pair of serovars. It is memory-mapped at runtime,
+so that a short-lived process does not need to evaluate the literals in wklm.py or
+compare the repository with itself.
+
+Layout:
+    magic(8 bytes) | header length(uint32) | JSON header | padding | data blocks
+
+The JSON header lists every block with its dtype, shape and offset, along with the
+size, modification time and sha256 digest of the source (wklm.py) and a digest of the
+comparison rules (comparison_digest). A snapshot whose source or comparison code has
+changed, or which is not valid, is stale and is rebuilt on load. If the package
+directory is not writable, the snapshot is built in the user cache directory instead.
+
+Build the snapshot with:
+    $ python -m serotools.snapshot
+"""
+
+import errno
+import hashlib
+import json
+import logging
+import mmap
+import os
+import struct
+import sys
+import numpy as np
+
+magic = b'SEROSNAP'
+snapshot_version = 3
+source_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'wklm.py')
+snapshot_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'wklm_scheme.snapshot')
+
+# Where the snapshot is built if the package directory is not writable
+user_cache_dir = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+user_snapshot_file = os.path.join(user_cache_dir, 'serotools', 'wklm_scheme.snapshot')
+
+# Strings are stored one column per block, joined by a separator that never
+# occurs in the repository
+separator = '\n'
+alignment = 8
+
+
+def build_snapshot(path=snapshot_file, source=source_file):
+    """Compiles the WKLM repository into a binary snapshot.
+    Args:
+        path(str):   The snapshot file to write.
+        source(str): The Python module holding the repository lists and dictionaries.
+    Returns:
+        path(str):   The snapshot file.
+    """
+
+    from serotools import serotools as sero
+
+    if not _writable(path):
+        raise PermissionError(errno.EACCES, 'The snapshot directory is not writable', path)
+
+    wklm = _load_source(source)
+    blocks = []
+
+    # Repository columns
+    for name, col in sero.wklm_list_cols.items():
+        blocks.append(_string_block('col:' + col, getattr(wklm, name)))
+
+    # Lookup dictionaries
+    for name in sero.wklm_dicts:
+        d = getattr(wklm, name)
+        blocks.append(_string_block('keys:' + name, list(d.keys())))
+        blocks.append(_string_block('values:' + name, list(d.values())))
+
+    # Write atomically so that concurrent readers never see a partial snapshot. The
+    # temporary file is created before the comparison levels, which take most of the
+    # build, are computed, so that they are not computed for a snapshot which cannot
+    # be written.
+    tmp_path = '{}.{}.tmp'.format(path, os.getpid())
+    try:
+        with open(tmp_path, 'wb') as o:
+            # Comparison levels between every pair of rows, in sparse form (see
+            # scheme_comparison_levels)
+            columns = {col: getattr(wklm, name) for name, col in sero.wklm_list_cols.items()}
+            scheme = sero.WKLMScheme(columns, *[getattr(wklm, name) for name in sero.wklm_dicts])
+            try:
+                levels = sero.scheme_comparison_levels(scheme)
+            except Exception as e:
+                logging.debug('The comparison levels of the WKLM snapshot were not built ({}).'.format(e))
+                levels = {}
+            for part, arr in levels.items():
+                blocks.append(('levels:' + part, arr, None))
+
+            header = {'version': snapshot_version, 'comparison_digest': sero.comparison_digest(),
+                      'source': _source_stamp(source), 'blocks': []}
+            offset = 0
+            for name, arr, n_strings in blocks:
+                header['blocks'].append({'name': name, 'dtype': arr.dtype.str, 'shape': list(arr.shape),
+                                         'offset': offset, 'strings': n_strings})
+                offset += _padded(arr.nbytes)
+            header_bytes = json.dumps(header).encode('utf-8')
+            data_start = _padded(len(magic) + 4 + len(header_bytes))
+
+            o.write(magic)
+            o.write(struct.pack('<I', len(header_bytes)))
+            o.write(header_bytes)
+            o.write(b'\0' * (data_start - len(magic) - 4 - len(header_bytes)))
+            for name, arr, n_strings in blocks:
+                o.write(arr.tobytes())
+                o.write(b'\0' * (_padded(arr.nbytes) - arr.nbytes))
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+    return path
+
+
+def is_stale(header, source=source_file):
+    """Determines whether a snapshot no longer matches its source.
+    Args:
+        header(dict): The snapshot header.
+        source(str):  The Python module holding the repository lists and dictionaries.
+    Returns:
+        (bool)
+    """
+
+    from serotools import serotools as sero
+
+    if header.get('version') != snapshot_version or \
+            header.get('comparison_digest') != sero.comparison_digest():
+        return True
+    if not os.path.exists(source):
+        return False  # nothing to compare against, e.g. an installed snapshot only
+    stamp = header['source']
+    st = os.stat(source)
+    if st.st_size == stamp['size'] and st.st_mtime_ns == stamp['mtime_ns']:
+        return False
+    return _sha256(source) != stamp['sha256']
+
+
+def load_snapshot(path=snapshot_file, source=source_file, rebuild=True):
+    """Loads the WKLM repository from a memory-mapped snapshot, building or rebuilding
+       the snapshot first if it is missing, stale or not valid. The packaged snapshot
+       (snapshot_file) falls back to user_snapshot_file if the package directory is not
+       writable, e.g. for a system-wide installation.
+    Args:
+        path(str):     The snapshot file.
+        source(str):   The Python module holding the repository lists and dictionaries.
+        rebuild(bool): Build the snapshot if it is missing or stale.
+    Returns:
+        snapshot(dict): 'columns', 'dicts' and 'levels' as described in read_snapshot(),
+                        or None if no up-to-date snapshot is available.
+    """
+
+    paths = [path, user_snapshot_file] if path == snapshot_file else [path]
+    for p in paths:
+        snapshot = read_snapshot(p) if os.path.exists(p) else None
+        if snapshot is not None and not is_stale(snapshot['header'], source):
+            return snapshot
+    if not rebuild or not os.path.exists(source):
+        return None
+
+    # The directory is checked first, as building the snapshot takes several seconds
+    writable = [p for p in paths if _writable(p, create=(p == user_snapshot_file))]
+    if not writable:
+        logging.warning('The WKLM snapshot could not be written to {}; the repository is loaded '
+                        'from {}.'.format(' or '.join(paths), source))
+        return None
+    try:
+        build_snapshot(writable[0], source)
+    except OSError as e:
+        logging.warning('The WKLM snapshot could not be written ({}); the repository is loaded '
+                        'from {}.'.format(e, source))
+        return None
+    return read_snapshot(writable[0])
+
+
+def read_snapshot(path=snapshot_file):
+    """Memory-maps a snapshot file.
+    Args:
+        path(str): The snapshot file.
+    Returns:
+        snapshot(dict):
+            header(dict):  The snapshot header.
+            columns(dict): Repository columns as lists, keyed by column name.
+            dicts(dict):   Lookup dictionaries, keyed by name (e.g. wklm_old_to_new).
+            levels(dict):  The comparison levels which are not 'incongruent', as arrays
+                           ('rows', 'cols', 'values'), or empty if they were not built.
+        or None if the file is not a snapshot, or is empty, truncated or corrupt.
+    """
+
+    size = os.path.getsize(path)
+    if size < len(magic) + 4:
+        return None
+    with open(path, 'rb') as i:
+        mm = mmap.mmap(i.fileno(), 0, access=mmap.ACCESS_READ)
+    if mm[:len(magic)] != magic:
+        return None
+
+    try:
+        header_len = struct.unpack('<I', mm[len(magic):len(magic) + 4])[0]
+        if len(magic) + 4 + header_len > size:
+            raise ValueError('the header is truncated')
+        header = json.loads(mm[len(magic) + 4:len(magic) + 4 + header_len].decode('utf-8'))
+        data_start = _padded(len(magic) + 4 + header_len)
+
+        arrays, n_strings = {}, {}
+        for b in header['blocks']:
+            dtype = np.dtype(b['dtype'])
+            count = int(np.prod(b['shape']))
+            # Raises ValueError if the data of the block is truncated
+            arrays[b['name']] = np.frombuffer(mm, dtype=dtype, count=count,
+                                              offset=data_start + b['offset']).reshape(b['shape'])
+            n_strings[b['name']] = b['strings']
+
+        snapshot = {'header': header, 'columns': {}, 'dicts': {}, 'levels': {}}
+        for name, arr in arrays.items():
+            kind, _, key = name.partition(':')
+            if kind == 'col':
+                snapshot['columns'][key] = _strings(arr, n_strings[name])
+            elif kind == 'keys':
+                values = 'values:' + key
+                snapshot['dicts'][key] = dict(zip(_strings(arr, n_strings[name]),
+                                                  _strings(arrays[values], n_strings[values])))
+            elif kind == 'levels':
+                snapshot['levels'][key] = arr
+    except (ValueError, TypeError, struct.error, KeyError) as e:
+        # json.JSONDecodeError and UnicodeDecodeError are ValueErrors
+        logging.warning('The WKLM snapshot {} is not valid ({}).'.format(path, e))
+        return None
+
+    return snapshot
+
+
+def _load_source(source):
+    """Loads the repository module from a file path."""
+
+    if source == source_file:
+        from serotools import wklm
+        return wklm
+    import importlib.util
+    spec = importlib.util.spec_from_file_location('wklm_source', source)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _padded(n):
+    return (n + alignment - 1) // alignment * alignment
+
+
+def _sha256(path):
+    with open(path, 'rb') as i:
+        return hashlib.sha256(i.read()).hexdigest()
+
+
+def _source_stamp(source):
+    st = os.stat(source)
+    return {'size': st.st_size, 'mtime_ns': st.st_mtime_ns, 'sha256': _sha256(source)}
+
+
+def _string_block(name, strings):
+    strings = list(strings)
+    if any(separator in s for s in strings):
+        raise ValueError("Block '{}' contains the separator character.".format(name))
+    return name, np.frombuffer(separator.join(strings).encode('utf-8'), dtype=np.uint8), len(strings)
+
+
+def _strings(arr, n):
+    return arr.tobytes().decode('utf-8').split(separator) if n else []
+
+
+def _writable(path, create=False):
+    """Determines whether a snapshot file can be written, optionally creating its
+       directory."""
+
+    directory = os.path.dirname(os.path.abspath(path))
+    if create:
+        try:
+            os.makedirs(directory, exist_ok=True)
+        except OSError:
+            return False
+    return os.path.isdir(directory) and os.access(directory, os.W_OK)
+
+
+if __name__ == '__main__':
+    print(build_snapshot(*sys.argv[1:2]))
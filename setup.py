@@ -34,6 +34,7 @@ setup(
     package_dir={'serotools': 'serotools'},
     include_package_data=True,
     install_requires=requirements,
+    python_requires='>=3.7',
     license="BSD",
     zip_safe=False,
     keywords=['bioinformatics', 'Salmonella', 'serovar', 'serotype', 'serotyping', 'White-Kauffmann-Le Minor'],
@@ -44,8 +45,6 @@ setup(
         'License :: OSI Approved :: BSD License',
         'Natural Language :: English',
         'Programming Language :: Python :: 3',
-        'Programming Language :: Python :: 3.5',
-        'Programming Language :: Python :: 3.6',
         'Programming Language :: Python :: 3.7',
         'Programming Language :: Python :: 3.8',
     ],
@@ -8,3 +8,56 @@ def test_error_on_empty_command_line():
     """Verify exception on empty command line."""
     with pytest.raises(SystemExit):
         cli.run_from_line("")
+
+
+def test_cache_size(tmpdir, capsys):
+    """Verify that --cache-size sizes the serovar cache."""
+    from serotools import serotools as sero
+    cli.run_from_line("query -s Typhimurium -e --cache-size 5")
+    assert sero.wklm_cache.maxsize == 5
+    cli.run_from_line("query -s Typhimurium -e --cache-size 0")
+    assert sero.wklm_cache.maxsize == 0
+    assert len(sero.wklm_cache) == 0
+    sero.wklm_cache.resize(sero.default_cache_size)
+
+
+def test_comparison_cache_size(tmpdir, capsys):
+    """Verify that --comparison-cache-size sizes the comparison cache."""
+    from serotools import serotools as sero
+    cli.run_from_line("compare -1 Typhimurium -2 Enteritidis --comparison-cache-size 5")
+    assert sero.comparison_cache.maxsize == 5
+    cli.run_from_line("compare -1 Typhimurium -2 Enteritidis --comparison-cache-size 0")
+    assert sero.comparison_cache.maxsize == 0
+    assert len(sero.comparison_cache) == 0
+    sero.comparison_cache.resize(sero.default_comparison_cache_size)
+
+
+def test_cache_options():
+    """Verify that every subcommand accepts the cache options."""
+    for command in ["query", "compare", "cluster", "serve"]:
+        args = cli.parse_arguments([command, "--cache-size", "5", "--disk-cache", "cache.db", "--disk-cache-max-age", "2"])
+        assert (args.cache_size, args.disk_cache, args.disk_cache_max_age) == (5, "cache.db", 2)
+        assert args.comparison_cache_size == cli.sero.default_comparison_cache_size
+        assert not args.disk_cache_prune_versions
+
+
+def test_disk_cache(tmpdir, capsys):
+    """Verify that --disk-cache keeps results across runs, and is closed afterwards."""
+    from serotools import serotools as sero
+    path = str(tmpdir.join('cache.db'))
+    cli.run_from_line("query -s Enteritidis --disk-cache {} --disk-cache-size 1".format(path))
+    expected = capsys.readouterr().out
+    assert sero.disk_cache is None
+    cli.run_from_line("query -s Enteritidis --disk-cache {} --disk-cache-max-age 1".format(path))
+    assert capsys.readouterr().out == expected
+    cache = sero.DiskCache(path, sero.get_scheme().version)
+    assert cache.info()['size'] == 1 and cache.get('matches', list(sero.input_to_wklm('Enteritidis').record))
+
+    """Entries of other versions are only removed with --disk-cache-prune-versions"""
+    other = sero.DiskCache(path, 'other')
+    other.put('wklm', 'Enteritidis', 1)
+    other.close()
+    cli.run_from_line("query -s Enteritidis --disk-cache {}".format(path))
+    assert sero.DiskCache(path, 'other').get('wklm', 'Enteritidis') == 1
+    cli.run_from_line("query -s Enteritidis --disk-cache {} --disk-cache-prune-versions".format(path))
+    assert sero.DiskCache(path, 'other').get('wklm', 'Enteritidis') is None
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+
+import sqlite3
+from serotools import diskcache
+from serotools.diskcache import DiskCache
+
+
+def test_get_put(tmpdir):
+
+    path = str(tmpdir.join('cache.db'))
+    cache = DiskCache(path, 'v1')
+    value = {'matches': [[1, 'exact']], 'messages': [], 'nan': float('nan')}
+
+    """Values are read back before and after they are written"""
+    assert cache.get('matches', ['I 4:i:–', None]) is None
+    cache.put('matches', ['I 4:i:–', None], value)
+    assert cache.get('matches', ['I 4:i:–', None])['matches'] == [[1, 'exact']]
+    cache.flush()
+    assert cache.get('matches', ['I 4:i:–', None])['matches'] == [[1, 'exact']]
+    assert (cache.hits, cache.misses) == (2, 1)
+
+    """Other processes read values once written, but only for the same version"""
+    assert DiskCache(path, 'v1').get('matches', ['I 4:i:–', None])['matches'] == [[1, 'exact']]
+    assert DiskCache(path, 'v2').get('matches', ['I 4:i:–', None]) is None
+    assert cache.info()['size'] == 1
+    cache.close()
+
+
+def test_flush(tmpdir, monkeypatch):
+
+    path = str(tmpdir.join('cache.db'))
+    monkeypatch.setattr(diskcache, 'flush_size', 3)
+    writer, reader = DiskCache(path, 'v1'), DiskCache(path, 'v1')
+
+    """Writes are buffered up to flush_size"""
+    for i in range(0, 2):
+        writer.put('wklm', i, i)
+    assert reader.get('wklm', 0) is None
+    writer.put('wklm', 2, 2)
+    assert [reader.get('wklm', i) for i in range(0, 3)] == [0, 1, 2]
+
+    """A reader does not block a writer"""
+    reader._conn.execute('BEGIN')
+    reader._conn.execute('SELECT COUNT(*) FROM entries').fetchone()
+    writer.put('wklm', 3, 3)
+    writer.flush()
+    reader._conn.execute('COMMIT')
+    assert reader.get('wklm', 3) == 3
+
+
+def test_prune(tmpdir, monkeypatch):
+
+    path = str(tmpdir.join('cache.db'))
+    clock = iter(range(1, 100))
+    monkeypatch.setattr(diskcache.time, 'time', lambda: next(clock))
+    old = DiskCache(path, 'v1')
+    old.put('wklm', 'a', 1)
+    old.close()
+
+    """The least recently used entries over max_entries are removed, of any version"""
+    cache = DiskCache(path, 'v2', max_entries=2)
+    for key in ['a', 'b', 'c']:
+        cache.put('wklm', key, key)
+        cache.flush()
+    assert cache.get('wklm', 'a') == 'a'
+    cache.flush()
+    assert cache.prune() == 2
+    assert [cache.get('wklm', key) for key in ['a', 'b', 'c']] == ['a', None, 'c']
+    assert DiskCache(path, 'v1').get('wklm', 'a') is None
+    cache.close()
+
+    """Entries of other versions are kept on close, and removed with other_versions"""
+    old = DiskCache(path, 'v1')
+    old.put('wklm', 'a', 1)
+    old.close()
+    cache = DiskCache(path, 'v2')
+    cache.close()
+    assert DiskCache(path, 'v1').get('wklm', 'a') == 1
+    cache = DiskCache(path, 'v2')
+    assert cache.prune(other_versions=True) == 1
+    assert DiskCache(path, 'v1').get('wklm', 'a') is None
+    cache.close()
+
+    """Entries unused for more than max_age days are removed"""
+    monkeypatch.setattr(diskcache.time, 'time', lambda: 2 * 86400)
+    cache = DiskCache(path, 'v2', max_age=1)
+    assert cache.prune() == 2
+    assert cache.info()['size'] == 0
+    cache.close()
+    assert sqlite3.connect(path).execute('SELECT COUNT(*) FROM entries').fetchone()[0] == 0
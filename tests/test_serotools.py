@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 
 import sys
+import itertools
 import pytest
 import numpy as np
 import pandas as pd
@@ -16,8 +17,136 @@ def test_wklm_repository():
     lst_len = len(st.wklm_name)
     assert all(len(lst) == lst_len for lst in [st.std_wklm_name, st.wklm_formula, 
             st.std_wklm_formula, st.wklm_subsp, st.wklm_O, st.wklm_P1, st.wklm_P2, 
-            st.wklm_other_H, st.wklm_group, st.wklm_old_group, st.wklm_name_to_formula]) == True   
-     
+            st.wklm_other_H, st.wklm_group, st.wklm_old_group, st.wklm_name_to_formula]) == True
+
+
+def test_get_scheme():
+
+    """The scheme is loaded once and shared"""
+    assert st.get_scheme() is st.get_scheme()
+    assert st.get_scheme().n_rows == len(st.wklm_name)
+
+    """Module-level names are served from the scheme"""
+    assert st.wklm_df is st.get_scheme().df
+    assert st.wklm_df.columns.tolist() == st.wklm_cols
+    assert st.wklm_old_to_new is st.get_scheme().old_to_new
+
+    """Unknown attributes still raise"""
+    with pytest.raises(AttributeError):
+        st.wklm_unknown
+
+
+def test_WKLMScheme_lookup(caplog):
+
+    scheme = st.get_scheme()
+
+    """Standardized names and formulas"""
+    assert scheme.columns['Name'][scheme.lookup('typhimurium')] == 'Typhimurium'
+    assert scheme.columns['Name'][scheme.lookup('i 1,9,12:g,m:–')] == 'Enteritidis'
+    assert scheme.lookup('Typhimurium') is None
+    assert scheme.lookup('test') is None
+
+    """Withdrawn names resolve to the current name"""
+    assert scheme.columns['Name'][scheme.lookup('ardwick')] == 'Rissen var. 14+'
+
+    """Identical formulas resolve to the last serovar"""
+    assert scheme.columns['Name'][scheme.lookup('i 6,7:c:1,5')] == 'Choleraesuis or Typhisuis'
+    assert scheme.columns['Name'][scheme.lookup('i 1,9,12:a:1,5')] == 'Miami or Sendai'
+
+    """Withdrawn names without a current repository name are not recognized"""
+    caplog.clear()
+    assert pd.isna(WKLMSerovar('Heves').name)
+    assert caplog.records[0].message == "The serovar 'Heves' was not recognized."
+
+
+def test_SerovarRecord():
+
+    obj = WKLMSerovar('Paratyphi A')
+
+    """Records are immutable tuples"""
+    assert isinstance(obj.record, tuple)
+    assert obj.record.Name == 'Paratyphi A'
+    assert obj.record.Input == 'Paratyphi A'
+    with pytest.raises(AttributeError):
+        obj.record.Name = 'Test'
+    assert obj.record._replace(Input='Test').Input == 'Test'
+    assert obj.record.Input == 'Paratyphi A'
+
+    """The meta view is built on access"""
+    assert obj.meta.index.tolist() == st.meta_cols
+    assert obj.meta is not obj.meta
+    assert obj.meta.tolist() == list(obj.record)
+
+    """Objects do not carry an attribute dict"""
+    assert not hasattr(obj, '__dict__')
+
+
+def test_WKLMScheme_factor_index():
+
+    scheme = st.get_scheme()
+
+    """The index agrees with matching_indices"""
+    for col, factor in [('Subspecies','i'),('O','4'),('O','1'),('P1','z4'),('P2','1'),('other_H','z45')]:
+        assert scheme.factor_index(col)[factor] == set(st.matching_indices(factor, scheme.columns[col]))
+    assert 'x' not in scheme.factor_index('O')
+    assert scheme.factor_index('O') is scheme.factor_index('O')
+
+
+def test_WKLMScheme_factor_key_index():
+
+    scheme = st.get_scheme()
+    col = [st.prep(x) for x in scheme.columns['P2']]
+
+    """Keys are the factors of a row, sorted numerically then alphabetically"""
+    key_index = scheme.factor_key_index('P2')
+    assert key_index[('1','5')][1] == {i for i, x in enumerate(col) if x == '1,5'}
+    assert key_index[('1','5')][0] == {'1': 1, '5': 1}
+    assert ('5','1') not in key_index
+    assert scheme.factor_key_index('P2') is key_index
+
+
+def test_FactorVocabulary():
+
+    """Factors are added on first use"""
+    vocabulary = st.FactorVocabulary(['–','1','5'])
+    assert len(vocabulary) == 3
+    assert vocabulary.bit('5') == 4
+    assert vocabulary.mask(['1','5']) == 6
+    assert vocabulary.bit('z99') == 8
+    assert vocabulary.factors == ['–','1','5','z99']
+    
+    """Factors which is_opt_factor matches with a regular expression"""
+    assert vocabulary.irregular == 0
+    vocabulary.bit('r1…')
+    assert vocabulary.irregular == 16
+    
+    """The scheme vocabularies hold every factor of the repository"""
+    scheme = st.get_scheme()
+    vocabulary = scheme.vocabulary('P1')
+    assert len(vocabulary) == 57
+    assert scheme.vocabulary('P1') is vocabulary
+    
+    
+def test_FactorMasks():
+
+    vocabulary = st.FactorVocabulary()
+    masks = lambda f: vocabulary.encode(st.parse_factors(f.lower()))
+    
+    m = masks('1,4,[5],12')
+    assert (m.required, m.maximal, m.optional, m.absent) == (0b0111, 0b1111, 0b1000, False)
+    assert masks('–').absent == True
+    assert masks('[1,2,7]').absent == True
+    
+    """Agrees with the string comparisons"""
+    pairs = [('5','5'),('5','4'),('e,n,z15','z15'),('e,n,z15','z39'),('e,n,z15','e,n,z15,z39'),
+             ('e,n,z15','e,n,z39'),('6,7,8,[14],[54]','6,7,8'),('6,7,8,[14],[54]','6,7,8,9'),
+             ('6,7,8,10,[14],[54]','6,7,8,9'),('g,m,[p],s','g,m,p,s'),('g,m,[p],s','g,m,s'),
+             ('g,m,[p],s','m,p,s'),('g,[m],[s],[t]','m'),('[1,2,7]','–'),('1,2,7','–'),
+             ('–','–'),('[1,2,7]','[5]'),('1,{15},{z45}','1,z45'),('r1…','r1'),('1,5','(5),1')]
+    for f1, f2 in pairs + [(f2, f1) for f1, f2 in pairs]:
+        assert masks(f1).is_opt_subset(masks(f2)) == st.is_opt_subset(f1, f2)
+        assert masks(f1).is_min_subset(masks(f2)) == st.is_min_subset(f1, f2)
+
 
 def test_WKLMSerovar(caplog):    
     
@@ -538,6 +667,96 @@ def test_cluster(tmpdir,capsys):
     assert in_cap4.out == in_expected4
                            
 
+def test_cluster_grouped(tmpdir,capsys):
+
+    file1 = tmpdir.join('sero_cluster_grouped.tsv')
+    with open(str(file1), 'w') as f1:
+        f1.write('clust1\tKivu\nclust1\tKivu\n\nclust1\tJaviana\nclust2\tKumasi\nclust3\tNA\n')
+
+    """Grouped input is printed as in the default mode"""
+    for v in [1, 2, 3]:
+        st.cluster(input_file=file1, v=v)
+        expected = capsys.readouterr().out
+        st.cluster(input_file=file1, v=v, grouped=True)
+        assert capsys.readouterr().out == expected
+
+    """Groups are read one at a time"""
+    assert list(st.grouped_clusters(file1)) == [('clust1', ['Kivu','Kivu','Javiana']), 
+                                                ('clust2', ['Kumasi']), ('clust3', ['NA'])]
+
+    """A cluster id which reappears after its group is an error"""
+    file2 = tmpdir.join('sero_cluster_ungrouped.tsv')
+    with open(str(file2), 'w') as f2:
+        f2.write('clust1\tKivu\nclust2\tKumasi\nclust1\tJaviana\n')
+    with pytest.raises(InvalidInput, match='Cluster clust1 reappears on line 3'):
+        st.cluster(input_file=file2, grouped=True)
+    assert capsys.readouterr().out.count('Kivu') == 2
+
+
+def test_cluster_partitioned(tmpdir,capsys):
+
+    file1 = tmpdir.join('sero_cluster_partitioned.tsv')
+    with open(str(file1), 'w') as f1:
+        f1.write('clust3\tKivu\nclust1\tKumasi\nclust3\tJaviana\n\nclust2\tNA\n'
+                 'clust1\tI 30:z10:e,n,z15\nclust3\tKivu\nclust10\tAustin\n')
+
+    """Partitioned input is printed as in the default mode, in either order"""
+    for order in ['first-seen', 'sorted']:
+        for v in [1, 2, 3]:
+            st.cluster(input_file=file1, v=v, order=order)
+            expected = capsys.readouterr().out
+            for partitions in [1, 3]:
+                st.cluster(input_file=file1, v=v, partitions=partitions, order=order)
+                assert capsys.readouterr().out == expected
+
+    """Clusters are printed as first seen, or sorted by id"""
+    st.cluster(input_file=file1, v=1)
+    assert [l.split('\t')[0] for l in capsys.readouterr().out.splitlines()[1:]] == ['clust3','clust1','clust2','clust10']
+    st.cluster(input_file=file1, v=1, partitions=2, order='sorted')
+    assert [l.split('\t')[0] for l in capsys.readouterr().out.splitlines()[1:]] == ['clust1','clust10','clust2','clust3']
+
+    """Grouped input is printed as first seen"""
+    with pytest.raises(InvalidInput):
+        st.cluster(input_file=file1, grouped=True, order='sorted')
+    with pytest.raises(InvalidInput):
+        st.cluster(input_file=file1, order='random')
+
+
+def test_cluster_jobs(tmpdir,capsys,monkeypatch):
+
+    file1 = tmpdir.join('sero_cluster_jobs.tsv')
+    with open(str(file1), 'w') as f1:
+        f1.write('clust3\tKivu\nclust3\tJaviana\nclust3\tKivu\nclust1\tKumasi\nclust2\tNA\n'
+                 'clust10\tAustin\nclust10\tI 6,7:a:1,7\n')
+
+    """Output is the same as with one process, in every mode"""
+    for kwargs in [{}, {'v': 3}, {'order': 'sorted'}, {'grouped': True}, {'partitions': 2}]:
+        st.cluster(input_file=file1, **kwargs)
+        expected = capsys.readouterr().out
+        st.cluster(input_file=file1, jobs=2, **kwargs)
+        assert capsys.readouterr().out == expected
+
+    """One pool of processes evaluates every partition"""
+    pools = []
+    process_pool = st.process_pool
+    monkeypatch.setattr(st, 'process_pool', lambda jobs: pools.append(jobs) or process_pool(jobs))
+    st.cluster(input_file=file1, partitions=3, jobs=2)
+    assert capsys.readouterr().out == expected
+    assert pools == [2]
+    monkeypatch.undo()
+
+    """Grouped clusters read before an error are printed, as with one process"""
+    with open(str(file1), 'a') as f1:
+        f1.write('clust1\tKivu\n')
+    with pytest.raises(InvalidInput):
+        st.cluster(input_file=file1, grouped=True)
+    expected = capsys.readouterr().out
+    with pytest.raises(InvalidInput):
+        st.cluster(input_file=file1, grouped=True, jobs=2)
+    assert capsys.readouterr().out == expected
+    assert len(expected.splitlines()) == 4
+
+
 def test_compare(tmpdir,capsys):                        
 
     """Input file"""    
@@ -582,6 +801,163 @@ def test_compare(tmpdir,capsys):
     assert inv_cap.out == inv_expected
           
 
+def test_compare_jobs(tmpdir,capsys,monkeypatch):
+
+    file1 = tmpdir.join('wklm_compare_jobs.tsv')
+    with open(str(file1), 'w') as f1:
+        f1.write('A\tB\nKumasi\tI 30:z10:e,n,z15\n\nEnteritidis\tI 9,12:g,m:–\n'
+                 'Typhimurium\tNA\nTyphi "x"\tTyphi\nHull\tI 16:b:1,2\n')
+    monkeypatch.setattr(st, 'compare_chunk_size', 2)
+
+    """Output is the same as with one process"""
+    for header in [False, True]:
+        st.compare(input_file=file1, header=header)
+        expected = capsys.readouterr().out
+        st.compare(input_file=file1, header=header, jobs=2)
+        assert capsys.readouterr().out == expected
+        assert len(expected.splitlines()) == 7 - header
+
+    """Pairs compared before an error are printed, as with one process"""
+    with open(str(file1), 'a') as f1:
+        f1.write('Hull\nHull\tHull\n')
+    with pytest.raises(IndexError):
+        st.compare(input_file=file1)
+    expected = capsys.readouterr().out
+    with pytest.raises(IndexError):
+        st.compare(input_file=file1, jobs=2)
+    assert capsys.readouterr().out == expected
+
+
+def test_comparison_level():
+
+    """Levels index comparison_results"""
+    assert st.comparison_results[st.comparison_level(WKLMSerovar('Enteritidis'), WKLMSerovar('I [1],9,12:g,m:–'))] == 'exact'
+    assert st.comparison_level(WKLMSerovar('Enteritidis'), WKLMSerovar('I 9,12:g,m:–')) == 2
+    assert st.comparison_level(WKLMSerovar('Enteritidis'), WKLMSerovar('9,12:g,m:–')) == 3
+    assert st.comparison_level(WKLMSerovar('Enteritidis'), WKLMSerovar('Typhimurium')) == 4
+    assert st.comparison_level(WKLMSerovar('Enteritidis'), WKLMSerovar('Heves')) == 0
+    
+    """Profiles hold the compared fields, with missing values as None"""
+    profile = WKLMSerovar('9,12:g,m:–').profile
+    assert profile.input == '9,12:g,m:–'
+    assert (profile.formula, profile.subspecies, profile.all_missing) == ('9,12:g,m:–', None, False)
+    assert profile.is_valid() and not WKLMSerovar('Heves').profile.is_valid()
+    
+    """SeroComp is a wrapper"""
+    comp = SeroComp(WKLMSerovar('Enteritidis'), WKLMSerovar('9,12:g,m:–'))
+    assert comp.result == 'minimally congruent'
+    assert (comp.is_exact(), comp.is_congruent(), comp.is_minimally_congruent()) == (False, False, True)
+
+
+def test_cached_comparison_level():
+
+    st.comparison_cache.clear()
+    pairs = [('Enteritidis', 'I 9,12:g,m:–'), ('Enteritidis', '9,12:g,m:–'), 
+             ('Enteritidis', 'Typhimurium'), ('Enteritidis', 'Heves'), ('Typhimurium', 'I 4,5,12:i:1,2')]
+    
+    """Cached levels agree with comparison_level in both orders"""
+    for subj, query in pairs + [(q, s) for s, q in pairs]:
+        s, q = WKLMSerovar(subj), WKLMSerovar(query)
+        assert st.cached_comparison_level(s, q) == st.comparison_level(s, q)
+        assert st.cached_comparison_level(s, q) == st.comparison_level(s, q)
+    
+    """Both orders share an entry, keyed on the profiles without their inputs, except 
+       for pairs of repository serovars, which are looked up in the scheme"""
+    assert len(st.comparison_cache) == len(pairs) - 1
+    hits = st.comparison_cache.hits
+    assert st.cached_comparison_level(WKLMSerovar('I 4,5,12:i:1,2'), WKLMSerovar('typhimurium')) == 2
+    assert st.comparison_cache.hits == hits + 1
+    
+    """Identical inputs are compared directly"""
+    assert st.cached_comparison_level(WKLMSerovar('Heves'), WKLMSerovar('Heves')) == 0
+    assert len(st.comparison_cache) == len(pairs) - 1
+    
+    """SeroComp uses the cache"""
+    hits = st.comparison_cache.hits
+    assert SeroComp(WKLMSerovar('9,12:g,m:–'), WKLMSerovar('Enteritidis')).result == 'minimally congruent'
+    assert st.comparison_cache.hits == hits + 1
+    st.comparison_cache.clear()
+
+
+def test_scheme_comparison_levels(monkeypatch):
+
+    scheme = st.get_scheme()
+    n = 60
+    small = st.WKLMScheme({col: scheme.columns[col][:n] for col in st.wklm_cols}, {}, {}, {})
+    levels = st.scheme_comparison_levels(small)
+    
+    """The scheme of the process is restored"""
+    assert st.get_scheme() is scheme
+    
+    """Levels agree with comparison_level for serovars with different inputs"""
+    matrix = np.full((n, n), 4, dtype=np.int8)
+    matrix[levels['rows'], levels['cols']] = levels['values']
+    objs = scheme.serovars[:n]
+    for i, j in itertools.product(range(n), repeat=2):
+        assert matrix[i,j] == st.comparison_level(objs[i].with_input('x'), objs[j])
+    
+    """The levels of the scheme are looked up by row"""
+    s, q = WKLMSerovar('Enteritidis'), WKLMSerovar('Typhimurium')
+    assert s.row is not None and WKLMSerovar('I 9,12:g,m:–').row is None
+    assert scheme.precomputed_level(s.row, q.row) == st.comparison_level(s, q) == 4
+    assert scheme.precomputed_level(s.row, None) is None
+    
+    """find_matches and SeroClust agree with the comparisons they replace"""
+    queries = ['Enteritidis', 'Paratyphi B', 'I 4,[5],12:b:1,2', 'Miami', 'Sendai', 'Dublin']
+    objs = [WKLMSerovar(x) for x in queries]
+    results = [sorted((m.query.name, m.result) for m in st.find_matches(obj)) for obj in objs]
+    clust = SeroClust('clust1', objs).levels
+    monkeypatch.setattr(scheme, '_comparison_levels', None)
+    monkeypatch.setattr(scheme, 'levels', None)
+    assert results == [sorted((m.query.name, m.result) for m in st.find_matches(obj)) for obj in objs]
+    assert np.array_equal(clust, SeroClust('clust1', objs).levels)
+
+
+def test_comparison_matrix():
+
+    formulas = ['I 1,{2,3,4}:i:1,2', 'I 1,3:i:1,2', 'I 1,3:i:–', 'Enteritidis', 'I 9,12:g,m:–', '9,12:g,m:–', 'Heves']
+    objs = [WKLMSerovar(f) for f in formulas]
+    levels = st.comparison_matrix(objs)
+    
+    """Every order of every pair is compared, as comparison_level"""
+    assert levels.shape == (len(objs), len(objs)) and levels.dtype == np.int8
+    for i, j in itertools.product(range(len(objs)), repeat=2):
+        assert levels[i,j] == st.comparison_level(objs[i], objs[j])
+    
+    """Congruence depends on the order of the pair"""
+    assert (levels[0,1], levels[1,0]) == (3, 2)
+    
+    """SeroClust keeps the matrix of its unique formulas"""
+    assert SeroClust('clust1', objs).levels.shape == (len(objs) - 1, len(objs) - 1)
+    assert st.comparison_matrix([]).shape == (0, 0)
+
+
+def test_congruence_levels():
+
+    scheme = st.get_scheme()
+    row = scheme.columns['Name'].index('Enteritidis')
+
+    """Levels index comparison_results"""
+    levels = st.congruence_levels(WKLMSerovar('Enteritidis'))
+    assert len(levels) == scheme.n_rows
+    assert st.comparison_results[levels[row]] == 'exact'
+    assert list(st.congruence_levels(WKLMSerovar('I [1],9,12:g,m:–'), [row, row])) == [1, 1]
+    assert list(st.congruence_levels(WKLMSerovar('I 9,12:g,m:–'), [row])) == [2]
+    assert list(st.congruence_levels(WKLMSerovar('9,12:g,m:–'), [row])) == [3]
+    assert len(st.congruence_levels(WKLMSerovar('Enteritidis'), [])) == 0
+
+    """Invalid input"""
+    assert not st.congruence_levels(WKLMSerovar('Heves')).any()
+
+    """Agrees with SeroComp"""
+    for input in ['Typhimurium','I 4,[5],12:i:1,2','I 6,7:–:–','4:i:z99',':–:1,2',
+                  'II 1,9,12:–:–','I 1,4,[5],12,z99:i:–','9,12:–:–:r1…']:
+        obj = WKLMSerovar(input)
+        rows = range(0, scheme.n_rows, 3)
+        results = [st.comparison_results[level] for level in st.congruence_levels(obj, rows)]
+        assert results == [SeroComp(obj, scheme.serovars[i]).result for i in rows]
+
+
 def test_fields_to_formula():
 
     """Default fields"""
@@ -654,11 +1030,11 @@ def test_find_matches():
 
     """Query is a subset - missing antigen and optional factor - all minimally congruent"""
     assert [obj.query.formula for obj in st.find_matches(WKLMSerovar('I [1],9,12:b:–'))] \
-        == ['I 9,12:b:e,n,z15', 'I [1],9,12:b:1,2', 'I [1],9,12:b:1,5', 'I 9,12:b:1,7']
+        == ['I [1],9,12:b:1,2', 'I [1],9,12:b:1,5', 'I 9,12:b:1,7', 'I 9,12:b:e,n,z15']
 
     """Query is a subset - missing antigen and optional factor removed - all minimally congruent"""
     assert [obj.query.formula for obj in st.find_matches(WKLMSerovar('I 9,12:b:–'))] \
-        == ['I 9,12:b:e,n,z15', 'I [1],9,12:b:1,2', 'I [1],9,12:b:1,5', 'I 9,12:b:1,7']
+        == ['I [1],9,12:b:1,2', 'I [1],9,12:b:1,5', 'I 9,12:b:1,7', 'I 9,12:b:e,n,z15']
 
     """Testing results"""
     assert [obj.result for obj in st.find_matches(WKLMSerovar('I [1],4,12,27:r,[i]:e,n,z15'))] \
@@ -682,7 +1058,7 @@ def test_find_matches():
        
     """Missing subspecies"""
     assert [obj.query.formula for obj in st.find_matches(WKLMSerovar('[1],4,[5],12,[27]:b:1,5'))] \
-        == ['II 4,12:b:1,5', 'I [1],4,[5],12,[27]:b:1,5']   
+        == ['I [1],4,[5],12,[27]:b:1,5', 'II 4,12:b:1,5']   
 
     """Missing subspecies2"""
     assert [obj.query.formula for obj in st.find_matches(WKLMSerovar('1,4,[5],12,[27]:b:1,5'))] \
@@ -702,13 +1078,13 @@ def test_find_matches():
            
     """Serovars with identical formulas"""        
     assert [obj.query.name for obj in st.find_matches(WKLMSerovar('I 1,4,[5],12:b:1,2:[z5],[z33]'))] \
-        == ['Paratyphi B var. L(+) tartrate (= d–tartrate)+', 'Paratyphi B']
+        == ['Paratyphi B', 'Paratyphi B var. L(+) tartrate (= d–tartrate)+']
 
     assert [obj.query.name for obj in st.find_matches(WKLMSerovar('Miami'))] \
         == ['Miami or Sendai']
      
     assert [obj.query.name for obj in st.find_matches(WKLMSerovar('Choleraesuis'))] \
-        == ['Choleraesuis or Typhisuis', 'Paratyphi C']
+        == ['Paratyphi C', 'Choleraesuis or Typhisuis']
     
 
 def test_formula_to_fields():
@@ -765,6 +1141,63 @@ def test_input_to_wklm():
     assert st.input_to_wklm('Miami or Sendai').formula == 'I [1],9,12:a:1,5'
 
 
+def test_input_to_wklm_cache(caplog):
+
+    st.wklm_cache.clear()
+
+    """Repeated inputs share an object"""
+    obj = st.input_to_wklm('Montevideo')
+    assert st.input_to_wklm('Montevideo') is obj
+    assert st.wklm_cache.info() == {'hits': 1, 'misses': 1, 'maxsize': st.default_cache_size, 'size': 1}
+
+    """Objects are immutable"""
+    with pytest.raises(AttributeError):
+        obj.input = 'Test'
+    assert obj.with_input('Test').input == 'Test'
+    assert obj.with_input('Test').meta.Input == 'Test'
+    assert obj.input == 'Montevideo'
+
+    """Messages are logged again when an object is reused"""
+    caplog.clear()
+    st.input_to_wklm('Test')
+    st.input_to_wklm('Test')
+    assert [r.message for r in caplog.records] == ["The serovar 'Test' was not recognized."] * 2
+
+    """Invalid input is not cached"""
+    with pytest.raises(InvalidInput):
+        st.input_to_wklm('9, 12:a:1')
+    with pytest.raises(InvalidInput):
+        st.input_to_wklm('9, 12:a:1')
+
+    """Clear"""
+    st.wklm_cache.clear()
+    assert st.wklm_cache.info() == {'hits': 0, 'misses': 0, 'maxsize': st.default_cache_size, 'size': 0}
+    assert st.input_to_wklm('Montevideo') is not obj
+
+
+def test_LRUCache():
+
+    cache = st.LRUCache(2)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    assert cache.get('a') == 1
+
+    """The least recently used entry is evicted"""
+    cache.put('c', 3)
+    assert cache.get('b') is None
+    assert cache.get('a') == 1 and cache.get('c') == 3
+    assert cache.info() == {'hits': 3, 'misses': 1, 'maxsize': 2, 'size': 2}
+
+    """Resize"""
+    cache.resize(1)
+    assert len(cache) == 1 and cache.get('c') == 3
+
+    """Disabled"""
+    cache.resize(0)
+    cache.put('d', 4)
+    assert len(cache) == 0 and cache.get('d') is None
+
+
 def test_is_min_subset():
 
     assert st.is_min_subset('5','5') == True
@@ -842,6 +1275,8 @@ def test_is_opt_factor():
     assert st.is_opt_factor('s','g,[m],(s),{t}') == True
     assert st.is_opt_factor('t','g,[m],(s),{t}') == True
     assert st.is_opt_factor('x','g,[m],(s),{t}') == False
+    assert st.is_opt_factor('m','g,m,s,t') == False
+    assert st.is_opt_factor('m',np.nan) == False
 
 
 def test_is_opt_subset():
@@ -948,12 +1383,42 @@ def test_min_factors():
     assert st.min_factors('–') == {'–'}
 
  
+def test_parse_factors():
+
+    factors = st.parse_factors('1,[5],(6),{15}{15,34},[z4,z23]')
+    assert factors.field == '1,[5],(6),{15}{15,34},[z4,z23]'
+    assert factors.required == {'1'}
+    assert factors.maximal == {'1','5','6','15','34','z4','z23'}
+
+    """Optional, exclusive and weak factors as found by is_opt_factor"""
+    assert factors.optional == {'5'}
+    assert factors.weak == {'6'}
+    assert factors.exclusive == {'1','15','5','34','4'}
+    for f in ['1','5','6','15','34','z4','z23','4','3','z','11','55']:
+        assert factors.is_opt_factor(f) == st.is_opt_factor(f, factors.field)
+
+    """Structures are parsed once"""
+    assert st.parse_factors('1,[5]') is st.parse_factors('1,[5]')
+
+    """Scheme rows and objects share structures"""
+    obj = WKLMSerovar('Paratyphi A')
+    assert obj.factors[0] is st.parse_factors('[1],2,12')
+    assert WKLMSerovar('I [1],2,12:a:[1,5]').factors == obj.factors
+    assert WKLMSerovar('I [1],2,12:a:[1,5]:[z45]').factors[3].optional == {'z45'}
+    assert WKLMSerovar('Test').factors == (None,) * 4
+
+
 def test_prep():
 
     assert st.prep('I 1,(4),[5],{10}{15}{15,34}:b:1,2:[z5],[z33]') == 'i 1,4,5,10,15,15,34:b:1,2:z5,z33'
     assert st.prep('I [1],4,[5],12:e,h:1,5:[R1…]') == 'i 1,4,5,12:e,h:1,5:r1'
     assert st.prep('I [1],4,[5],12:e,h:1,5:[R1...]') == 'i 1,4,5,12:e,h:1,5:r1'
 
+    """Ellipses are removed before brackets"""
+    assert st.prep('.[..') == '...'
+    assert st.prep('....') == '.'
+    assert pd.isna(st.prep(np.nan))
+
     
 def test_query(tmpdir,capsys):                        
 
@@ -1092,6 +1557,16 @@ def test_standardize_input():
     assert st.standardize_input('houtenae 6,14:z4,z23:–') == 'IV 6,14:z4,z23:–'
     assert st.standardize_input('bongori 1,40:z35:–') == 'V 1,40:z35:–'
     assert st.standardize_input('indica 41:b:1,7') == 'VI 41:b:1,7'
+    assert st.standardize_input('INDICA 41:b:1,7') == 'VI 41:b:1,7'
+    
+    """A substituted subsp may be followed by a later subsp name"""
+    assert st.standardize_input('entericandica 41:b:1,7') == 'VI 41:b:1,7'
+    assert st.standardize_input('salamaeindica 41:b:1,7') == 'IIindica 41:b:1,7'
+    
+    """SeqSero output"""
+    assert st.standardize_input('Typhimurium Sdf prediction: Enteritidis') == 'Typhimurium'
+    assert st.standardize_input('potential monophasic variant of Typhimurium') == 'I 4:i:–'
+    assert st.standardize_input('Potential monophasic variant of Heidelberg') == 'I 4:r:–'
     
     """Remove leading/trailing whitespace"""
     assert st.standardize_input(' Enterica 16:i:z6 ') == 'I 16:i:z6'
@@ -1101,3 +1576,128 @@ def test_standardize_unicode():
  
     assert st.standardize_unicode('I [1],4,[5],12:e,h:1,5:[R1...]') == 'I [1],4,[5],12:e,h:1,5:[R1…]'
     assert st.standardize_unicode('I 4,5,12:i:-') == 'I 4,5,12:i:–'
+    assert st.standardize_unicode('I 4,5,12:i:\u2212') == 'I 4,5,12:i:–'
+    assert st.standardize_unicode('....') == '….'
+
+
+def test_subset_indices():
+
+    scheme = st.get_scheme()
+
+    def previous_subset_indices(factors, col):
+        s_indices = set()
+        subsets = [c for r in range(1, len(factors)) for c in itertools.combinations(factors, r)]
+        for s in subsets:
+            all_matches = set()
+            s = sorted([int(i) if i.isdigit() else i for i in s], key=lambda x: (isinstance(x, str), x))
+            for p in itertools.permutations(s):
+                if len(all_matches):
+                    break
+                all_matches = set(np.flatnonzero(col == ','.join(map(str, p))))
+                s_indices.update(all_matches)
+        return s_indices
+
+    """Same rows as trying every combination of factors in every order"""
+    for f, factors in [('P2', ['5','1','2']), ('P2', ['z42','1','5','1']), ('P2', ['05','1','z6']),
+                       ('O', ['1','4','5','12']), ('other_H', ['z70','z49','z49','e','z75','z55'])]:
+        col = scheme.df[f].apply(st.prep)
+        assert st.subset_indices(factors, scheme.factor_key_index(f)) == \
+            previous_subset_indices(factors, col)
+
+    """No proper subset of a single factor"""
+    assert st.subset_indices(['1'], scheme.factor_key_index('P2')) == set()
+
+    """Invalid numeric factors"""
+    with pytest.raises(ValueError):
+        st.subset_indices(['1','\u00b2'], scheme.factor_key_index('P2'))
+
+
+def test_query_results(monkeypatch):
+
+    calls = []
+    find_matches = st.find_matches
+    monkeypatch.setattr(st, 'find_matches', lambda obj: calls.append(obj.input) or find_matches(obj))
+    serovars = ['Kumasi\n', 'I 4,12:b:–\n', '\n', 'Kumasi  \n', 'Kumasi\n']
+    
+    """Each distinct query is resolved once, and its rows repeated in input order"""
+    rows = list(st.query_results(serovars))
+    assert calls == ['Kumasi', 'I 4,12:b:–']
+    kumasi = st.query_rows('Kumasi')
+    assert rows == kumasi + st.query_rows('I 4,12:b:–') + kumasi + kumasi
+    assert kumasi == [['Kumasi', 'Kumasi', 'I 30:z10:e,n,z15', 'exact']]
+    
+    """Exact queries"""
+    assert list(st.query_results(['Kumasi', 'Kumasi'], exact=True)) == kumasi * 2
+
+    """Repeats are resolved once even if the serovar cache is disabled"""
+    calls.clear()
+    st.resize_caches(cache_size=0)
+    try:
+        assert list(st.query_results(serovars)) == rows
+    finally:
+        st.resize_caches()
+    assert calls == ['Kumasi', 'I 4,12:b:–']
+
+
+def test_query_jobs(tmpdir,capsys,monkeypatch):
+
+    file1 = tmpdir.join('wklm_query_jobs.txt')
+    with open(str(file1), 'w') as f1:
+        f1.write('Kumasi\nI 4,12:b:–\n\nKumasi  \nHull\nI 4,12:b:–\nKumasi\n')
+    monkeypatch.setattr(st, 'compare_chunk_size', 2)
+
+    """Output is the same as with one process"""
+    st.query(input_file=file1)
+    expected = capsys.readouterr().out
+    st.query(input_file=file1, jobs=2)
+    assert capsys.readouterr().out == expected
+    assert len(expected.splitlines()) == 1 + 3 + 2 + 2 * len(st.query_rows('I 4,12:b:–'))
+
+    """Queries resolved before an error are printed, as with one process"""
+    with open(str(file1), 'a') as f1:
+        f1.write('::\nHull\n')
+    with pytest.raises(KeyError):
+        st.query(input_file=file1)
+    expected = capsys.readouterr().out
+    with pytest.raises(KeyError):
+        st.query(input_file=file1, jobs=2)
+    assert capsys.readouterr().out == expected
+
+
+def test_disk_cache(tmpdir,caplog,monkeypatch):
+
+    path = str(tmpdir.join('cache.db'))
+    queries = ['I 4,[5],12:b:1,2', 'Enteritidis or Dublin', 'Paratyphi B or Java', 'Miami/Sendai', 'Kumasi']
+    expected = [st.query_rows(q) for q in queries]
+    
+    """Matches and merged inputs are stored, and reused by later runs with their messages"""
+    st.open_disk_cache(path)
+    st.wklm_cache.clear()
+    caplog.clear()
+    assert [st.query_rows(q) for q in queries] == expected
+    messages = caplog.record_tuples
+    st.close_disk_cache()
+    assert st.disk_cache is None
+    
+    st.open_disk_cache(path)
+    st.wklm_cache.clear()
+    monkeypatch.setattr(st, 'find_match_rows', None)
+    monkeypatch.setattr(st, 'merge_wklm_objs', None)
+    caplog.clear()
+    assert [st.query_rows(q) for q in queries] == expected
+    assert caplog.record_tuples == messages
+    assert st.disk_cache.info()['size'] == len(queries) + 2
+    
+    """Entries are keyed by the version of the scheme"""
+    assert st.disk_cache.version == st.get_scheme().version
+    st.close_disk_cache()
+    st.wklm_cache.clear()
+
+
+def test_write_tsv(capsys):
+
+    """Rows are written as pd.DataFrame.to_csv writes them"""
+    rows = [['Typhi "x"', np.nan, None, '', 'a b', 1, 'congruent']]
+    st.write_tsv(rows)
+    expected = pd.DataFrame(rows).to_csv(index=False, header=False, sep='\t', na_rep='NA')
+    assert capsys.readouterr().out == expected == '"Typhi ""x"""\tNA\tNA\t\ta b\t1\tcongruent\n'
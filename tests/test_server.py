@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+
+import threading
+import pytest
+from serotools import serotools as st
+from serotools import server
+
+
+@pytest.fixture
+def serve(tmpdir):
+    """Starts servers in background threads, and stops them after the test."""
+
+    servers = []
+    def start(address=('127.0.0.1', 0), **kwargs):
+        srv = server.SeroServer(address, **kwargs)
+        threading.Thread(target=srv.serve_forever, daemon=True).start()
+        servers.append(srv)
+        return srv
+    yield start
+    for srv in servers:
+        srv.shutdown()
+        srv.close()
+
+
+def test_batcher():
+
+    batches = []
+    def handle(items):
+        batches.append(items)
+        return [item * 2 for item in items]
+    batcher = server.Batcher(handle, max_size=4, max_wait=0.5)
+
+    """Items submitted concurrently are handled in batches of up to max_size"""
+    results = {}
+    threads = [threading.Thread(target=lambda i=i: results.update({i: batcher.submit(i)}))
+               for i in range(0, 8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    batcher.close()
+    assert results == {i: i * 2 for i in range(0, 8)}
+    assert batcher.items == 8 and batcher.batches == len(batches) == 2
+    assert batcher.max_batch == 4
+
+    """An error raised by the handler is raised for every item of the batch"""
+    batcher = server.Batcher(lambda items: 1 / 0, max_wait=0)
+    with pytest.raises(ZeroDivisionError):
+        batcher.submit(1)
+    batcher.close()
+
+
+def test_query(serve):
+
+    srv = serve()
+    serovars = ['Paratyphi A', 'I 4,[5],12:b:1,2', '', 'Paratyphi B or Java', 'Paratyphi A', 'Kumasi']
+
+    """Rows are those of query_results, with missing values as null"""
+    status, body = server.request(srv.address, '/query', {'serovars': serovars})
+    assert status == 200 and body['columns'] == ['Input', 'Name', 'Formula', 'Match']
+    assert body['rows'] == [[None if v is st.np.nan else v for v in row]
+                            for row in st.query_results(serovars)]
+    status, body = server.request(srv.address, '/query', {'serovars': ['Paratyphi A'], 'exact': True})
+    assert body['rows'] == [['Paratyphi A', 'Paratyphi A', 'I [1],2,12:a:[1,5]', 'exact']]
+
+    """Each distinct query is resolved once"""
+    assert len(srv.results) == 5
+
+    """Requests without a valid Content-Length are rejected"""
+    for length in ['x', '-1']:
+        conn = server.http.client.HTTPConnection(*srv.address)
+        conn.putrequest('POST', '/query')
+        conn.putheader('Content-Length', length)
+        conn.endheaders()
+        response = conn.getresponse()
+        assert response.status == 400 and 'Content-Length' in response.read().decode('utf-8')
+        conn.close()
+
+    """Messages are returned, and errors raised by serotools are reported"""
+    status, body = server.request(srv.address, '/query', {'serovars': ['Test']})
+    assert status == 200 and body['rows'] == [['Test', None, None, 'none']]
+    assert body['messages'] == [{'level': 'ERROR', 'message': "The serovar 'Test' was not recognized."}]
+    status, body = server.request(srv.address, '/query', {'serovars': ['Kumasi', '::']})
+    assert status == 422 and 'KeyError' in body['error']
+
+
+def test_compare_cluster(serve, tmpdir):
+
+    srv = serve(str(tmpdir.join('serotools.sock')))
+
+    """Serve on a Unix domain socket"""
+    status, body = server.request(srv.address, '/compare', {'pairs': [['Hull', 'I 16:b:1,2'], ['Dunkwa', 'Utah']]})
+    assert status == 200
+    assert body['rows'] == [['Hull', 'Hull', 'I 16:b:1,2', 'I 16:b:1,2', 'Hull', 'I 16:b:1,2', 'exact'],
+                            ['Dunkwa', 'Dunkwa', 'I 6,8:d:1,7', 'Utah', 'Utah', 'I 6,8:c:1,5', 'incongruent']]
+
+    """Clusters are given as a list or a dict, and tables are those printed by cluster"""
+    clusters = [['cluster1', ['Dunkwa', 'Dunkwa', 'Utah']], ['cluster2', ['Hull']]]
+    status, body = server.request(srv.address, '/cluster', {'clusters': clusters, 'verbosity': 1})
+    assert body['columns'] == ['ClusterID', 'ClusterSize', 'Input', 'Name', 'Formula']
+    assert body['rows'] == [['cluster1', 3, 'Dunkwa', 'Dunkwa', 'I 6,8:d:1,7'],
+                            ['cluster2', 1, 'Hull', 'Hull', 'I 16:b:1,2']]
+    status, body = server.request(srv.address, '/cluster', {'clusters': dict(clusters), 'sort_by': 'e,c'})
+    assert body['columns'][-3:] == ['P_Exact', 'P_Congruent', 'P_MinCon']
+    assert body['rows'][0][5:] == [0.6667, 0.6667, 0.6667]
+
+    """Invalid requests"""
+    assert server.request(srv.address, '/compare', {'pairs': [['Hull']]})[0] == 400
+    assert server.request(srv.address, '/cluster', {'clusters': [], 'verbosity': 2})[0] == 400
+    assert server.request(srv.address, '/cluster', {'clusters': clusters, 'sort_by': 'x'})[0] == 400
+    assert server.request(srv.address, '/cluster', {'clusters': clusters, 'sort_by': [1]})[0] == 400
+    assert server.request(srv.address, '/clusters', {})[0] == 404
+
+
+def test_batching(serve):
+
+    srv = serve(batch_wait=0.5)
+
+    """Concurrent requests are answered in batches, as if sent one at a time"""
+    serovars = ['Typhimurium', 'Enteritidis', 'Dublin', 'Typhimurium']
+    expected = [server.request(srv.address, '/query', {'serovars': [s]})[1] for s in serovars]
+    srv.results.clear()
+    responses = {}
+    threads = [threading.Thread(target=lambda i=i: responses.update(
+                   {i: server.request(srv.address, '/query', {'serovars': [serovars[i]]})[1]}))
+               for i in range(0, len(serovars))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert [responses[i] for i in range(0, len(serovars))] == expected
+    assert srv.batcher.batches < len(serovars) * 2
+
+    """Health reports requests and batches"""
+    status, body = server.request(srv.address, '/health')
+    assert status == 200 and body['status'] == 'ok'
+    assert body['requests'] == len(serovars) * 2 and body['scheme_version'] == st.get_scheme().version
+
+
+def test_reload(serve, tmpdir):
+
+    st.wklm_cache.clear()
+    st.open_disk_cache(str(tmpdir.join('cache.db')))
+    srv = serve()
+    scheme = st.get_scheme()
+    server.request(srv.address, '/query', {'serovars': ['Paratyphi B or Java']})
+
+    """The scheme is loaded again, caches are cleared and the disk cache is reopened"""
+    status, body = server.request(srv.address, '/reload', {})
+    assert status == 200 and body['scheme_version'] == body['previous_version'] == scheme.version
+    assert st.get_scheme() is not scheme
+    assert len(srv.results) == 0 and len(st.wklm_cache) == 0
+    assert st.disk_cache.path == str(tmpdir.join('cache.db'))
+    assert st.disk_cache.get('wklm', 'Paratyphi B or Java') is not None
+    status, body = server.request(srv.address, '/query', {'serovars': ['Paratyphi A']})
+    assert body['rows'] == [['Paratyphi A', 'Paratyphi A', 'I [1],2,12:a:[1,5]', 'exact']]
+    st.close_disk_cache()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+
+import os
+import shutil
+from serotools import serotools as st
+from serotools import snapshot
+
+
+def test_build_snapshot(tmpdir):
+
+    path = str(tmpdir.join('wklm.snapshot'))
+    snapshot.build_snapshot(path)
+    snap = snapshot.read_snapshot(path)
+
+    """Columns and dictionaries match the repository"""
+    assert snap['columns']['Name'] == list(st.wklm_name)
+    assert snap['columns']['Std_Formula'] == list(st.std_wklm_formula)
+    assert snap['columns']['other_H'] == list(st.wklm_other_H)
+    assert snap['dicts']['wklm_old_to_new'] == st.wklm_old_to_new
+
+    """Comparison levels are stored in sparse form, and match those of the repository"""
+    scheme = st.WKLMScheme(snap['columns'], {}, {}, {}, snap['levels'])
+    assert len(snap['levels']['values']) < scheme.n_rows * 2
+    assert (scheme.comparison_levels == st.get_scheme().comparison_levels).all()
+
+
+def test_read_snapshot(tmpdir):
+
+    """Not a snapshot"""
+    path = tmpdir.join('not_a_snapshot')
+    path.write('serotools')
+    assert snapshot.read_snapshot(str(path)) is None
+
+    """Empty and truncated snapshots are not read, and are rebuilt on load"""
+    source = str(tmpdir.join('wklm.py'))
+    shutil.copy(snapshot.source_file, source)
+    path = str(tmpdir.join('wklm.snapshot'))
+    snapshot.build_snapshot(path, source)
+    with open(path, 'rb') as i:
+        data = i.read()
+    for size in [0, 20, len(data) // 2]:
+        with open(path, 'wb') as o:
+            o.write(data[:size])
+        assert snapshot.read_snapshot(path) is None
+    snap = snapshot.load_snapshot(path, source)
+    assert snap['columns']['Name'] == list(st.wklm_name)
+    assert os.path.getsize(path) == len(data)
+
+
+def test_load_snapshot(tmpdir, monkeypatch):
+
+    source = str(tmpdir.join('wklm.py'))
+    path = str(tmpdir.join('wklm.snapshot'))
+    shutil.copy(snapshot.source_file, source)
+
+    """Missing snapshot is built"""
+    assert snapshot.load_snapshot(path, source, rebuild=False) is None
+    snap = snapshot.load_snapshot(path, source)
+    assert os.path.exists(path)
+    assert not snapshot.is_stale(snap['header'], source)
+
+    """Touching the source without changing it does not require a rebuild"""
+    os.utime(source, ns=(0, 0))
+    assert not snapshot.is_stale(snap['header'], source)
+
+    """Changing the source triggers a rebuild"""
+    with open(source, 'a') as f:
+        f.write("\nwklm_name = wklm_name[:-1] + ['Test']\n")
+    assert snapshot.is_stale(snap['header'], source)
+    snap = snapshot.load_snapshot(path, source)
+    assert snap['columns']['Name'][-1] == 'Test'
+    assert not snapshot.is_stale(snap['header'], source)
+
+    """Changing the comparison code triggers a rebuild"""
+    monkeypatch.setattr(st, 'comparison_digest', lambda: 'changed')
+    assert snapshot.is_stale(snap['header'], source)
+
+
+def test_unwritable_snapshot(tmpdir, monkeypatch, caplog):
+
+    source = str(tmpdir.join('wklm.py'))
+    shutil.copy(snapshot.source_file, source)
+    tmpdir.join('blocked').write('')
+    path = str(tmpdir.join('blocked', 'wklm.snapshot'))
+
+    """A snapshot which cannot be written is not built, and a warning is logged"""
+    assert snapshot.load_snapshot(path, source) is None
+    assert 'could not be written' in caplog.text
+
+    """The packaged snapshot is built in the user cache directory instead"""
+    user_file = str(tmpdir.join('cache', 'serotools', 'wklm_scheme.snapshot'))
+    monkeypatch.setattr(snapshot, 'snapshot_file', path)
+    monkeypatch.setattr(snapshot, 'user_snapshot_file', user_file)
+    snap = snapshot.load_snapshot(path, source)
+    assert snap['columns']['Name'] == list(st.wklm_name)
+    assert os.path.exists(user_file)